@@ -0,0 +1,100 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+import orjson
+from cachetools import TTLCache
+from redis.exceptions import RedisError
+
+from utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# A retried /generate with the same Idempotency-Key gets the first response back
+IDEMPOTENCY_TTL_SECONDS = 24 * 3600
+
+# Stored under a claimed key until the first request has a response to replay
+PENDING = "pending"
+
+# A claim outlives any /generate request, but a process that dies mid-request
+# only blocks retries with its key briefly
+IDEMPOTENCY_PENDING_TTL_SECONDS = 120
+
+# Used when Redis is not configured; only covers retries hitting this process.
+# Entries are (expires_at, value) so a PENDING claim expires before a response.
+_local_keys = TTLCache(maxsize=10_000, ttl=IDEMPOTENCY_TTL_SECONDS)
+_local_keys_lock = threading.Lock()
+
+
+def _cache_key(user_id: int, idempotency_key: str) -> str:
+    return f"idemp:{user_id}:{idempotency_key}"
+
+
+def claim_idempotency_key(user_id: int, idempotency_key: str) -> Optional[str]:
+    """
+    Claim an idempotency key for a new request unless it is already claimed.
+
+    Returns:
+        None if the caller now owns the key and should handle the request;
+        PENDING if the first request with this key is still being handled;
+        otherwise the first request's response body (JSON) to replay.
+    """
+    key = _cache_key(user_id, idempotency_key)
+    redis_client = get_redis()
+
+    if redis_client is not None:
+        try:
+            if redis_client.set(key, PENDING, nx=True, ex=IDEMPOTENCY_PENDING_TTL_SECONDS):
+                return None
+            return redis_client.get(key)
+        except RedisError as e:
+            logger.warning("Could not claim idempotency key", extra={
+                "user_id": user_id,
+                "error": str(e)
+            })
+
+    now = time.monotonic()
+    with _local_keys_lock:
+        expires_at, existing = _local_keys.get(key, (now, None))
+        if expires_at <= now:
+            _local_keys[key] = (now + IDEMPOTENCY_PENDING_TTL_SECONDS, PENDING)
+            return None
+        return existing
+
+
+def store_idempotent_response(user_id: int, idempotency_key: str, body: dict):
+    """Keep a claimed key's response body so retries get the same response back"""
+    key = _cache_key(user_id, idempotency_key)
+    serialized = orjson.dumps(body).decode()
+    redis_client = get_redis()
+
+    if redis_client is not None:
+        try:
+            redis_client.set(key, serialized, ex=IDEMPOTENCY_TTL_SECONDS)
+        except RedisError as e:
+            logger.warning("Could not store idempotent response", extra={
+                "user_id": user_id,
+                "error": str(e)
+            })
+
+    with _local_keys_lock:
+        _local_keys[key] = (time.monotonic() + IDEMPOTENCY_TTL_SECONDS, serialized)
+
+
+def release_idempotency_key(user_id: int, idempotency_key: str):
+    """Forget a claimed key when its job was never started, so the retry can go through"""
+    key = _cache_key(user_id, idempotency_key)
+    redis_client = get_redis()
+
+    if redis_client is not None:
+        try:
+            redis_client.delete(key)
+        except RedisError as e:
+            logger.warning("Could not release idempotency key", extra={
+                "user_id": user_id,
+                "error": str(e)
+            })
+
+    with _local_keys_lock:
+        _local_keys.pop(key, None)
@@ -0,0 +1,70 @@
+import logging
+
+import orjson
+
+from redis.exceptions import RedisError
+
+from utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs never change, so their status can be served from Redis
+JOB_STATUS_TTL_SECONDS = 24 * 3600
+FINAL_STATUSES = ("completed", "failed")
+
+
+def job_status_payload(job) -> dict:
+    """Build the /status response body from a ContentJob row or instance"""
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "topic": job.topic,
+        "created_at": job.created_at.isoformat(),
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        "result": {
+            "report": job.report_path,
+            "blog": job.blog_path
+        } if job.status == "completed" else None,
+        "error": job.error_message
+    }
+
+
+def _cache_key(user_id: int, job_id: str) -> str:
+    return f"job_status:{user_id}:{job_id}"
+
+
+def cache_job_status(job):
+    """Store a finished job's status payload so polls skip the database"""
+    redis_client = get_redis()
+    if redis_client is None or job.status not in FINAL_STATUSES:
+        return
+
+    try:
+        redis_client.setex(
+            _cache_key(job.user_id, job.job_id),
+            JOB_STATUS_TTL_SECONDS,
+            orjson.dumps(job_status_payload(job))
+        )
+    except RedisError as e:
+        logger.warning("Could not cache job status", extra={
+            "job_id": job.job_id,
+            "error": str(e)
+        })
+
+
+def get_cached_job_status(user_id: int, job_id: str):
+    """Return the cached status payload for a finished job, or None"""
+    redis_client = get_redis()
+    if redis_client is None:
+        return None
+
+    try:
+        cached = redis_client.get(_cache_key(user_id, job_id))
+    except RedisError as e:
+        logger.warning("Could not read cached job status", extra={
+            "job_id": job_id,
+            "error": str(e)
+        })
+        return None
+
+    return orjson.loads(cached) if cached else None
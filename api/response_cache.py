@@ -0,0 +1,73 @@
+import logging
+import threading
+import time
+from functools import wraps
+
+import orjson
+from fastapi import HTTPException, Response
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Admin aggregates scan whole tables; dashboards poll them far more often
+# than the numbers meaningfully change
+ADMIN_CACHE_TTL_SECONDS = 30
+
+
+def cached_response(ttl: float = ADMIN_CACHE_TTL_SECONDS):
+    """
+    Serve a sync endpoint's JSON body from memory for `ttl` seconds.
+
+    Entries are keyed by the endpoint's query parameters (the database
+    session is ignored). If recomputing an expired entry fails, the last
+    good body is served with `X-Cache: stale` instead of a 500; otherwise
+    `X-Cache` is `hit` or `miss`. `endpoint.cache_clear()` drops every entry.
+
+    Usage:
+        @app.get("/admin/stats")
+        @cached_response(ttl=30)
+        def admin_stats(db: Session = Depends(get_db)):
+            ...
+    """
+    def decorator(func):
+        entries = {}  # params -> (expires_at, serialized body)
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = tuple(sorted((k, v) for k, v in kwargs.items() if not isinstance(v, Session)))
+            now = time.monotonic()
+
+            with lock:
+                entry = entries.get(key)
+            if entry is not None and entry[0] > now:
+                return _json_response(entry[1], "hit")
+
+            try:
+                body = orjson.dumps(func(*args, **kwargs))
+            except HTTPException:
+                raise
+            except Exception as e:
+                if entry is None:
+                    raise
+                logger.warning("Serving stale cached response", extra={
+                    "endpoint": func.__name__,
+                    "error": str(e)
+                })
+                return _json_response(entry[1], "stale")
+
+            with lock:
+                entries[key] = (now + ttl, body)
+            return _json_response(body, "miss")
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+def _json_response(body: bytes, cache_status: str) -> Response:
+    return Response(content=body, media_type="application/json", headers={"X-Cache": cache_status})
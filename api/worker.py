@@ -0,0 +1,128 @@
+"""
+Background worker for crew executions.
+
+Run alongside the API so crew runs never execute inside a uvicorn worker:
+    arq api.worker.WorkerSettings
+
+The API enqueues jobs here when REDIS_URL is configured and falls back to
+running run_crew as a FastAPI background task otherwise.
+"""
+
+import asyncio
+import os
+from datetime import datetime
+
+from arq import func
+from arq.connections import RedisSettings
+
+from research_and_blog_crew.crew import crew_pool
+from database.models import SessionLocal, ContentJob
+from api.job_status import cache_job_status
+from utils.logger import setup_logger
+
+logger = setup_logger("worker", "worker.log")
+
+MAX_CONCURRENT_JOBS = int(os.getenv("MAX_CONCURRENT_JOBS", "5"))
+
+def run_crew(job_id: str, topic: str, user_id: int):
+    """Background task to run crew"""
+    db = SessionLocal()
+    job = db.query(ContentJob).filter(ContentJob.job_id == job_id).first()
+    
+    try:
+        logger.info("Crew execution started", extra={
+            "job_id": job_id,
+            "user_id": user_id
+        })
+
+        start_time = datetime.utcnow()
+        
+        # Get individual task outputs
+        report_content = ""
+        blog_content = ""
+        
+        with crew_pool.checkout() as (crew_instance, crew):
+            result = crew.kickoff(inputs={"topic": topic})
+
+            # Extract outputs from completed tasks before the crew goes back to the pool
+            if hasattr(crew_instance, 'tasks'):
+                for task in crew_instance.tasks:
+                    if hasattr(task, 'output') and task.output:
+                        output_str = str(task.output.raw) if hasattr(task.output, 'raw') else str(task.output)
+                        
+                        # Identify which task this is
+                        if 'report' in task.description.lower() or 'strategic' in task.description.lower():
+                            report_content = output_str
+                        elif 'blog' in task.description.lower():
+                            blog_content = output_str
+        
+        # Fallback: use final result if individual outputs not found
+        if not report_content and not blog_content:
+            full_output = str(result)
+            report_content = full_output
+            blog_content = full_output
+        
+        # Save files manually
+        report_path = f"/app/output/strategic_report_{job_id}.md"
+        blog_path = f"/app/output/blog_post_{job_id}.md"
+
+        # Write the result to both files (crew output is combined)
+        with open(report_path, "w") as f:
+            f.write(report_content)
+        
+        with open(blog_path, "w") as f:
+            f.write(blog_content)
+
+        # Estimate cost (rough calculation)
+        # GPT-4: $0.03 per 1K tokens input, $0.06 per 1K tokens output
+        # Average generation uses ~15K tokens total
+        estimated_tokens = 15000
+        estimated_cost = (estimated_tokens / 1000) * 0.045  # Average rate
+        
+        end_time = datetime.utcnow()
+        execution_time = int((end_time - start_time).total_seconds())
+        
+        job.status = "completed"
+        job.completed_at = end_time
+        job.execution_time = execution_time
+        job.tokens_used = estimated_tokens
+        job.estimated_cost = estimated_cost
+        job.report_path = f"output/strategic_report_{job_id}.md"
+        job.blog_path = f"output/blog_post_{job_id}.md"
+        
+        db.commit()
+        cache_job_status(job)
+
+        logger.info("Crew execution completed", extra={
+            "job_id": job_id,
+            "execution_time": execution_time,
+            "tokens": estimated_tokens,
+            "cost": f"${estimated_cost:.4f}",
+            "files_created": [report_path, blog_path]
+        })
+        
+    except Exception as e:
+        logger.error("Crew execution failed", extra={
+            "job_id": job_id,
+            "error": str(e)
+        }, exc_info=True)
+        
+        job.status = "failed"
+        job.error_message = str(e)
+        job.completed_at = datetime.utcnow()
+        db.commit()
+        cache_job_status(job)
+    
+    finally:
+        db.close()
+
+async def run_crew_task(ctx, job_id: str, topic: str, user_id: int):
+    """arq task wrapper; the crew itself is blocking so it runs in a thread"""
+    await asyncio.to_thread(run_crew, job_id, topic, user_id)
+
+class WorkerSettings:
+    """arq worker configuration"""
+    functions = [func(run_crew_task, name="run_crew")]
+    redis_settings = RedisSettings.from_dsn(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    max_jobs = MAX_CONCURRENT_JOBS
+    job_timeout = 30 * 60  # crew runs take minutes, not seconds
@@ -1,7 +1,8 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, JSON, Boolean, Float
+from sqlalchemy import create_engine, event, text, Column, Integer, String, DateTime, Text, JSON, Boolean, Float, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
+import hashlib
 import secrets
 import os
 
@@ -13,6 +14,7 @@ class User(Base):
     id = Column(Integer, primary_key=True)
     email = Column(String, unique=True, index=True, nullable=False)
     api_key = Column(String, unique=True, nullable=False)
+    api_key_hash = Column(String(32), unique=True, index=True, nullable=True)  # auth looks keys up by this
     subscription_tier = Column(String, default="free")  # free, pro, enterprise
     usage_count = Column(Integer, default=0)
     monthly_limit = Column(Integer, default=10)
@@ -23,13 +25,17 @@ class User(Base):
 
 class ContentJob(Base):
     __tablename__ = "content_jobs"
+    __table_args__ = (
+        # /status looks jobs up by owner and job id together
+        Index("ix_job_user_job", "user_id", "job_id"),
+    )
     
     id = Column(Integer, primary_key=True)
     job_id = Column(String, unique=True, index=True, nullable=False)
-    user_id = Column(Integer, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
     topic = Column(String, nullable=False)
-    status = Column(String, default="processing")  # processing, completed, failed
-    created_at = Column(DateTime, default=datetime.utcnow)
+    status = Column(String, default="processing", index=True)  # processing, completed, failed
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     completed_at = Column(DateTime, nullable=True)
     report_path = Column(String, nullable=True)
     blog_path = Column(String, nullable=True)
@@ -43,10 +49,39 @@ DB_DIR = os.getenv("DB_DIR", ".")
 os.makedirs(DB_DIR, exist_ok=True)
 DATABASE_PATH = os.path.join(DB_DIR, "ai_content_crew.db")
 
-# Database initialization
-engine = create_engine('sqlite:///ai_content_crew.db', echo=False)
+# Database initialization - DATABASE_URL can point at Postgres in production,
+# where the pool gives real concurrency (SQLite serializes writes regardless)
+DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DATABASE_PATH}")
+# Under high concurrency on Postgres, point DATABASE_URL at PgBouncer (port
+# 6432) in transaction pooling mode rather than raising these per process
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "2.0"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,  # fail fast instead of queueing forever
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE,  # replace connections before server/proxy idle timeouts drop them
+    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL lets readers run alongside the writer; NORMAL sync is safe under WAL"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-64000")  # 64 MB page cache per connection
+        cursor.execute("PRAGMA mmap_size=268435456")  # read up to 256 MB through mmap
+        cursor.close()
+
 def init_db():
     """Initialize database tables"""
     try:
@@ -56,6 +91,9 @@ def init_db():
         # Verify tables were created
         from sqlalchemy import inspect
         inspector = inspect(engine)
+        _backfill_api_key_hashes(inspector)
+        with engine.begin() as conn:
+            _create_missing_indexes(conn)
         tables = inspector.get_table_names()
         print(f"✅ Created tables: {', '.join(tables)}")
         
@@ -64,9 +102,51 @@ def init_db():
         print(f"❌ Database initialization failed: {e}")
         raise
 
+def _backfill_api_key_hashes(inspector):
+    """Add api_key_hash to databases created before it existed and hash existing keys"""
+    columns = {column["name"] for column in inspector.get_columns("users")}
+    with engine.begin() as conn:
+        if "api_key_hash" not in columns:
+            conn.execute(text("ALTER TABLE users ADD COLUMN api_key_hash VARCHAR(32)"))
+            conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_api_key_hash ON users (api_key_hash)"))
+        
+        rows = conn.execute(text("SELECT id, api_key FROM users WHERE api_key_hash IS NULL")).all()
+        for user_id, api_key in rows:
+            conn.execute(
+                text("UPDATE users SET api_key_hash = :api_key_hash WHERE id = :id"),
+                {"api_key_hash": hash_api_key(api_key), "id": user_id}
+            )
+
+def _create_missing_indexes(conn):
+    """
+    Add content_jobs indexes to databases created before they existed.
+    
+    create_all() skips tables that already exist, so older deployments
+    would otherwise never get them. The user_id foreign key is only
+    created with new tables (SQLite cannot add constraints in place).
+    """
+    for index in ContentJob.__table__.indexes:
+        index.create(bind=conn, checkfirst=True)
+
+def warm_pool(size: int = DB_POOL_SIZE):
+    """Open `size` pooled connections up front so early requests skip the connect cost"""
+    connections = []
+    try:
+        for _ in range(size):
+            conn = engine.connect()
+            conn.execute(text("SELECT 1"))
+            connections.append(conn)
+    finally:
+        for conn in connections:
+            conn.close()
+
 def generate_api_key():
-    """Generate secure API key"""
-    return f"acc_{secrets.token_urlsafe(32)}"
+    """Generate secure API key (192 bits of entropy)"""
+    return f"acc_{secrets.token_urlsafe(24)}"
+
+def hash_api_key(api_key: str) -> str:
+    """Fixed-length digest of an API key, used as its lookup key"""
+    return hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
 
 # Run this to create tables
 if __name__ == "__main__":
@@ -5,18 +5,31 @@ Usage:
     python examples/python_client.py
 """
 
-import requests
+import httpx
+import random
 import time
 import json
+import uuid
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
 API_KEY = None  # Will be set after signup
 
+# Retries for /generate on network errors and 5xx responses
+GENERATE_ATTEMPTS = 3
+
+# Status polling backoff: 2s, 4s, 8s, ... capped at 30s, each +/-20%
+POLL_INITIAL_DELAY = 2
+POLL_MAX_DELAY = 30
+POLL_JITTER = 0.2
+
+# One client for every call so the connection is kept alive between requests
+http = httpx.Client(base_url=API_BASE_URL, timeout=30.0)
+
 def signup(email: str):
     """Sign up and get API key"""
-    response = requests.post(
-        f"{API_BASE_URL}/signup",
+    response = http.post(
+        "/signup",
         json={"email": email}
     )
     
@@ -33,19 +46,34 @@ def signup(email: str):
         return None
 
 def generate_content(api_key: str, topic: str):
-    """Generate content for a topic"""
-    headers = {"X-API-Key": api_key}
-    response = requests.post(
-        f"{API_BASE_URL}/generate",
-        json={"topic": topic},
-        headers=headers
-    )
+    """Generate content for a topic, retrying safely on transient failures"""
+    # Same key on every retry, so the server starts (and bills) the job only once
+    headers = {"X-API-Key": api_key, "Idempotency-Key": uuid.uuid4().hex}
+    
+    for attempt in range(1, GENERATE_ATTEMPTS + 1):
+        try:
+            response = http.post(
+                "/generate",
+                json={"topic": topic},
+                headers=headers
+            )
+        except httpx.TransportError as e:
+            if attempt == GENERATE_ATTEMPTS:
+                raise
+            print(f"⚠️  Request failed ({e}), retrying...")
+            time.sleep(POLL_INITIAL_DELAY * attempt)
+            continue
+        
+        if response.status_code < 500 or attempt == GENERATE_ATTEMPTS:
+            break
+        print(f"⚠️  Server error {response.status_code}, retrying...")
+        time.sleep(POLL_INITIAL_DELAY * attempt)
     
     if response.status_code == 200:
         data = response.json()
         print(f"\n🚀 Generation started!")
         print(f"   Job ID: {data['job_id']}")
-        print(f"   Status: {data['status']}")
+        print(f"   Status: {data.get('status', 'processing')}")
         return data['job_id']
     else:
         print(f"❌ Generation failed: {response.json()}")
@@ -54,8 +82,8 @@ def generate_content(api_key: str, topic: str):
 def check_status(api_key: str, job_id: str):
     """Check job status"""
     headers = {"X-API-Key": api_key}
-    response = requests.get(
-        f"{API_BASE_URL}/status/{job_id}",
+    response = http.get(
+        f"/status/{job_id}",
         headers=headers
     )
     
@@ -69,6 +97,7 @@ def wait_for_completion(api_key: str, job_id: str, max_wait: int = 300):
     """Wait for job to complete (max 5 minutes)"""
     print(f"\n⏳ Waiting for completion...")
     start_time = time.time()
+    delay = POLL_INITIAL_DELAY
     
     while time.time() - start_time < max_wait:
         status_data = check_status(api_key, job_id)
@@ -87,7 +116,9 @@ def wait_for_completion(api_key: str, job_id: str, max_wait: int = 300):
                 print(f"   Error: {status_data.get('error', 'Unknown error')}")
                 return status_data
         
-        time.sleep(5)  # Check every 5 seconds
+        # Back off exponentially with jitter so many clients don't poll in lockstep
+        time.sleep(delay * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER))
+        delay = min(delay * 2, POLL_MAX_DELAY)
     
     print(f"\n⏱️  Timeout: Job did not complete in {max_wait} seconds")
     return None
@@ -95,8 +126,8 @@ def wait_for_completion(api_key: str, job_id: str, max_wait: int = 300):
 def get_usage(api_key: str):
     """Get usage statistics"""
     headers = {"X-API-Key": api_key}
-    response = requests.get(
-        f"{API_BASE_URL}/usage",
+    response = http.get(
+        "/usage",
         headers=headers
     )
     
@@ -154,4 +185,7 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        main()
+    finally:
+        http.close()
\ No newline at end of file
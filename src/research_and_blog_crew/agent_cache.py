@@ -0,0 +1,122 @@
+"""
+On-disk cache of agent task outputs.
+
+With the cache enabled, an agent that has already produced an output for
+an identical agent configuration, model, task and context returns it
+instead of calling the LLM again. It is off by default so runs always
+produce fresh content, and only `train --agent-cache` turns it on: a
+cached iteration skips the executor, so it records no new training data.
+test and replay never use it, since they exist to execute tasks again.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from crewai import Agent, Task
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = Path(".cache") / "agent_cache.db"
+CACHE_TTL_SECONDS = int(os.getenv("AGENT_CACHE_TTL", str(7 * 24 * 3600)))
+
+
+class AgentResponseCache:
+    """SQLite-backed key/value store for agent outputs, safe to share between threads"""
+
+    def __init__(self, path: Path = CACHE_PATH, ttl: float = CACHE_TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        self.enabled = False
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS agent_cache "
+                "(key TEXT PRIMARY KEY, output TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            # Expired rows are never served; drop them so the file stays small
+            self._conn.execute(
+                "DELETE FROM agent_cache WHERE created_at <= ?",
+                (time.time() - self.ttl,)
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def make_key(agent: Agent, task: Task, context: Optional[str]) -> str:
+        """Hash of everything that determines the agent's answer"""
+        parts = [
+            agent.role,
+            agent.goal,
+            agent.backstory,
+            str(getattr(agent.llm, "model", agent.llm)),
+            ",".join(sorted(tool.name for tool in agent.tools or [])),
+            task.description,
+            task.expected_output,
+            context or ""
+        ]
+        return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT output FROM agent_cache WHERE key = ? AND created_at > ?",
+                (key, time.time() - self.ttl)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, output: str):
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO agent_cache (key, output, created_at) VALUES (?, ?, ?)",
+                (key, output, time.time())
+            )
+            conn.commit()
+
+    def clear(self):
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM agent_cache")
+            conn.commit()
+
+
+agent_cache = AgentResponseCache()
+
+
+def enable_agent_cache():
+    """Turn the agent response cache on for this process (used by train --agent-cache)"""
+    agent_cache.enabled = True
+
+
+def clear_agent_cache():
+    """Drop every cached agent output"""
+    agent_cache.clear()
+
+
+class CachedAgent(Agent):
+    """Agent that reuses earlier outputs for identical tasks while the agent cache is enabled"""
+
+    def execute_task(self, task: Task, context: Optional[str] = None, tools=None) -> str:
+        if not agent_cache.enabled:
+            return super().execute_task(task, context=context, tools=tools)
+
+        key = agent_cache.make_key(self, task, context)
+        cached = agent_cache.get(key)
+        if cached is not None:
+            logger.info(f"Agent cache hit for '{self.role}'")
+            return cached
+
+        output = super().execute_task(task, context=context, tools=tools)
+        agent_cache.set(key, output)
+        return output
@@ -1,9 +1,16 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task, tool
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from crewai_tools import SerperDevTool, ScrapeWebsiteTool, FileReadTool
+from crewai_tools import ScrapeWebsiteTool, FileReadTool
+from research_and_blog_crew.tools.cached_search import CachedSerperTool
+from research_and_blog_crew.agent_cache import CachedAgent
 from typing import List, Optional
+from functools import lru_cache
+from contextlib import contextmanager
+import copy
 import logging
+import queue
+import yaml
 from datetime import datetime
 
 # Configure logging for production monitoring
@@ -13,6 +20,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Parts of get_crew_info() that never change, built once at import
+CREW_INFO_STATIC = {
+    "process_type": "sequential",
+    "phases": (
+        "Research & Intelligence",
+        "Report Creation",
+        "Blog Content",
+        "Optimization",
+        "Quality Assurance",
+        "Final Delivery"
+    ),
+    "output_files": (
+        "strategic_report.md",
+        "blog_post.md",
+        "seo_optimized_blog.md",
+        "visual_content_guide.md",
+        "engagement_optimized_blog.md",
+        "final_edited_content.md",
+        "plagiarism_report.md",
+        "accessibility_report.md",
+        "final_content_package.md"
+    )
+}
+
+# crew_fast() stops after the blog post: no optimization or QA phases
+CREW_INFO_FAST = {
+    **CREW_INFO_STATIC,
+    "phases": CREW_INFO_STATIC["phases"][:3],
+    "output_files": (
+        "strategic_report.md",
+        "blog_post_with_seo.md"
+    )
+}
+
+@lru_cache(maxsize=None)
+def shared_search_tool() -> CachedSerperTool:
+    """
+    The one search tool behind every Serper-backed accessor.
+
+    @tool already memoizes per crew instance; this also shares the instance
+    across the ten search accessors and across crew instances.
+    """
+    return CachedSerperTool()
+
 # ============================================
 # PRODUCTION-GRADE CREW CONFIGURATION
 # ============================================
@@ -47,7 +98,7 @@ class ResearchAndBlogCrew():
     @tool
     def web_search_tool(self):
         """Web search tool for finding information online"""
-        return SerperDevTool()
+        return shared_search_tool()
     
     @tool
     def scraping_tool(self):
@@ -62,64 +113,92 @@ class ResearchAndBlogCrew():
     @tool
     def academic_search_tool(self):
         """Academic search tool (using SerperDev for now)"""
-        return SerperDevTool()
+        return shared_search_tool()
     
     @tool
     def fact_checking_tool(self):
         """Fact checking tool (using web search)"""
-        return SerperDevTool()
+        return shared_search_tool()
     
     @tool
     def source_verification_tool(self):
         """Source verification tool (using web search)"""
-        return SerperDevTool()
+        return shared_search_tool()
     
     @tool
     def trend_analysis_tool(self):
         """Trend analysis tool (using web search)"""
-        return SerperDevTool()
+        return shared_search_tool()
     
     @tool
     def market_data_tool(self):
         """Market data tool (using web search)"""
-        return SerperDevTool()
+        return shared_search_tool()
     
     @tool
     def keyword_research_tool(self):
         """Keyword research tool (using web search)"""
-        return SerperDevTool()
+        return shared_search_tool()
     
     @tool
     def seo_analysis_tool(self):
         """SEO analysis tool (using web search)"""
-        return SerperDevTool()
+        return shared_search_tool()
     
     @tool
     def plagiarism_detection_tool(self):
         """Plagiarism detection tool (using web search)"""
-        return SerperDevTool()
+        return shared_search_tool()
     
     @tool
     def citation_validator_tool(self):
         """Citation validator tool (using web search)"""
-        return SerperDevTool()
+        return shared_search_tool()
 
     # ============================================
     # TOOL INITIALIZATION
     # ============================================
     
+    # One research analyst per parallel research task. Async tasks run in
+    # their own threads and Agent.execute_task replaces the agent's executor,
+    # so two tasks running at once must never share an Agent instance.
+
+    @agent
+    def research_facts_analyst(self) -> Agent:
+        """Core facts, statistics, and expert opinions"""
+        return CachedAgent(
+            config=self.agents_config["research_facts_analyst"],
+            verbose=True
+        )
+
     @agent
-    def research_analyst(self) -> Agent:
-        """Combined research, fact-checking, and trend analysis"""
-        return Agent(
-            config=self.agents_config["research_analyst"],
+    def research_trends_analyst(self) -> Agent:
+        """Current and emerging trends"""
+        return CachedAgent(
+            config=self.agents_config["research_trends_analyst"],
+            verbose=True
+        )
+
+    @agent
+    def research_sources_analyst(self) -> Agent:
+        """Source verification and fact-checking"""
+        return CachedAgent(
+            config=self.agents_config["research_sources_analyst"],
+            verbose=True
+        )
+
+    @agent
+    def research_market_analyst(self) -> Agent:
+        """Market and industry landscape"""
+        return CachedAgent(
+            config=self.agents_config["research_market_analyst"],
             verbose=True
         )
 
     @agent
     def report_writer(self) -> Agent:
         """Strategic report creation"""
-        return Agent(
+        return CachedAgent(
             config=self.agents_config["report_writer"],
             verbose=True
         )
@@ -127,7 +206,7 @@ class ResearchAndBlogCrew():
     @agent
     def blog_content_creator(self) -> Agent:
         """Blog writing + SEO optimization combined"""
-        return Agent(
+        return CachedAgent(
             config=self.agents_config["blog_content_creator"],
             verbose=True
         )
@@ -135,7 +214,7 @@ class ResearchAndBlogCrew():
     @agent
     def quality_editor(self) -> Agent:
         """Final editing, QA, and accessibility checks"""
-        return Agent(
+        return CachedAgent(
             config=self.agents_config["quality_editor"],
             verbose=True
         )
@@ -143,12 +222,43 @@ class ResearchAndBlogCrew():
     # ============================================
     # TASK DEFINITIONS (Order matters!)
     # ============================================
+    # @task and @agent memoize per crew instance, so calling a task method
+    # inside context=[...] returns the same Task object the crew executes;
+    # no task or agent is built (or read from the YAML config) twice.
+
+    # Research angles are independent: run them concurrently and fan in
+    # to the report writer, so the phase takes max(T_i) instead of sum(T_i)
 
     @task
-    def comprehensive_research_task(self) -> Task:
+    def research_facts_task(self) -> Task:
         return Task(
-            config=self.tasks_config["comprehensive_research_task"],
-            agent=self.research_analyst()
+            config=self.tasks_config["research_facts_task"],
+            agent=self.research_facts_analyst(),
+            async_execution=True
+        )
+
+    @task
+    def research_trends_task(self) -> Task:
+        return Task(
+            config=self.tasks_config["research_trends_task"],
+            agent=self.research_trends_analyst(),
+            async_execution=True
+        )
+
+    @task
+    def research_sources_task(self) -> Task:
+        return Task(
+            config=self.tasks_config["research_sources_task"],
+            agent=self.research_sources_analyst(),
+            async_execution=True
+        )
+
+    @task
+    def research_market_task(self) -> Task:
+        return Task(
+            config=self.tasks_config["research_market_task"],
+            agent=self.research_market_analyst(),
+            async_execution=True
         )
 
     @task
@@ -156,7 +266,12 @@ class ResearchAndBlogCrew():
         return Task(
             config=self.tasks_config["strategic_report_task"],
             agent=self.report_writer(),
-            context=[self.comprehensive_research_task()],
+            context=[
+                self.research_facts_task(),
+                self.research_trends_task(),
+                self.research_sources_task(),
+                self.research_market_task()
+            ],
             output_file="output/strategic_report.md"
         )
 
@@ -183,13 +298,18 @@ class ResearchAndBlogCrew():
     # ============================================
 
     @crew
-    def crew(self) -> Crew:
+    def crew(self, memory: bool = True) -> Crew:
         """
         Assembles the production-grade crew with all agents and tasks.
-        Uses sequential process for logical workflow execution.
+        Uses sequential process for logical workflow execution; the four
+        research tasks are async and run in parallel before the report.
         
         Process Flow:
-        Research → Report → Strategy → Blog → Optimization → QA → Delivery
+        Research (facts | trends | sources | market) → Report → Blog → QA
+        
+        Args:
+            memory (bool): Give the crew short-term, long-term and entity
+                           memory. Crews reused across jobs turn it off.
         
         Returns:
             Crew: Configured crew ready for execution
@@ -200,11 +320,11 @@ class ResearchAndBlogCrew():
             logger.info(f"Total Tasks: {len(self.tasks)}")
             
             return Crew(
-                agents=self.agents,  # All 12 agents
+                agents=self.agents,  # All 7 agents
                 tasks=self.tasks,    # All 14 tasks in order
                 process=Process.sequential,  # Execute tasks in order
                 verbose=True,
-                memory=True,  # Enable memory for context retention
+                memory=memory,  # Enable memory for context retention
                 cache=True,   # Cache results to avoid redundant work
                 max_rpm=30,   # Rate limiting for API calls
                 share_crew=False,  # Keep crew private
@@ -214,6 +334,53 @@ class ResearchAndBlogCrew():
             logger.error(f"Error assembling crew: {str(e)}")
             raise
 
+    def crew_fast(self, memory: bool = True) -> Crew:
+        """
+        Lean crew for interactive and exploratory runs: research, report and
+        blog post only, skipping the quality editor and its review task.
+        
+        Process Flow:
+        Research (facts | trends | sources | market) → Report → Blog
+        
+        Args:
+            memory (bool): Give the crew short-term, long-term and entity
+                           memory. Crews reused across jobs turn it off.
+        
+        Returns:
+            Crew: Configured crew ready for execution
+        """
+        try:
+            logger.info("Assembling fast Research and Blog Crew...")
+            
+            return Crew(
+                agents=[
+                    self.research_facts_analyst(),
+                    self.research_trends_analyst(),
+                    self.research_sources_analyst(),
+                    self.research_market_analyst(),
+                    self.report_writer(),
+                    self.blog_content_creator()
+                ],
+                tasks=[
+                    self.research_facts_task(),
+                    self.research_trends_task(),
+                    self.research_sources_task(),
+                    self.research_market_task(),
+                    self.strategic_report_task(),
+                    self.seo_blog_creation_task()
+                ],
+                process=Process.sequential,
+                verbose=True,
+                memory=memory,
+                cache=True,
+                max_rpm=30,
+                share_crew=False,
+                output_log_file=True
+            )
+        except Exception as e:
+            logger.error(f"Error assembling fast crew: {str(e)}")
+            raise
+
     # ============================================
     # UTILITY METHODS FOR PRODUCTION
     # ============================================
@@ -241,43 +408,106 @@ class ResearchAndBlogCrew():
             logger.error(f"Crew execution failed: {str(e)}")
             raise
 
-    def get_crew_info(self) -> dict:
+    def get_crew_info(self, fast: bool = False) -> dict:
         """
         Returns information about the crew configuration.
         Useful for monitoring and debugging.
         
+        Args:
+            fast (bool): Describe crew_fast() instead of the full crew
+        
         Returns:
             dict: Crew configuration details
         """
-        agents = getattr(self, "_agents", [])
-        tasks = getattr(self, "_tasks", [])
-
         return {
-            "total_agents": len(agents),
-            "total_tasks": len(tasks),
-            "process_type": "sequential",
-            "phases": [
-                "Research & Intelligence",
-                "Report Creation",
-                "Blog Content",
-                "Optimization",
-                "Quality Assurance",
-                "Final Delivery"
-            ],
-            "output_files": [
-                "strategic_report.md",
-                "blog_post.md",
-                "seo_optimized_blog.md",
-                "visual_content_guide.md",
-                "engagement_optimized_blog.md",
-                "final_edited_content.md",
-                "plagiarism_report.md",
-                "accessibility_report.md",
-                "final_content_package.md"
-            ]
+            **(CREW_INFO_FAST if fast else CREW_INFO_STATIC),
+            "total_agents": len(getattr(self, "agents", [])),
+            "total_tasks": len(getattr(self, "tasks", []))
         }
 
 
+# ============================================
+# CONFIG LOADING
+# ============================================
+
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=None)
+def _parse_yaml(config_path: str) -> dict:
+    with open(config_path, "r", encoding="utf-8") as file:
+        return yaml.load(file, Loader=_YAML_LOADER)
+
+
+def _load_yaml(config_path) -> dict:
+    """
+    Parse each config file once per process instead of once per crew instance.
+
+    CrewBase fills in llm/tools/context objects in place on the loaded
+    dicts, so every instance gets its own deep copy of the parsed config.
+    """
+    return copy.deepcopy(_parse_yaml(str(config_path)))
+
+
+ResearchAndBlogCrew.load_yaml = staticmethod(_load_yaml)
+
+
+# ============================================
+# CREW REUSE
+# ============================================
+
+class CrewPool:
+    """
+    Reusable (ResearchAndBlogCrew, Crew) pairs, built lazily on first use.
+
+    Agents, tools and LLM clients are created once per pooled crew instead
+    of once per run. A crew is not safe to kick off from two threads at
+    once, so each run checks one out exclusively; at most one crew per
+    concurrent run is ever built.
+
+    Pools shared between jobs run their crews without memory: crewAI keeps
+    memory in storage shared by every crew with the same agents, so one
+    job's research (another user's, in the API) would otherwise surface in
+    the next job's output. Single-user CLI runs use memory=True pools.
+
+    Usage:
+        with crew_pool.checkout() as (crew_instance, crew):
+            result = crew.kickoff(inputs={"topic": topic})
+    """
+
+    def __init__(self, fast: bool = False, memory: bool = False):
+        self.fast = fast
+        self.memory = memory
+        self._idle = queue.Queue()
+
+    @contextmanager
+    def checkout(self):
+        try:
+            crew_instance, crew = self._idle.get_nowait()
+        except queue.Empty:
+            crew_instance = ResearchAndBlogCrew()
+            if self.fast:
+                crew = crew_instance.crew_fast(memory=self.memory)
+            else:
+                crew = crew_instance.crew(memory=self.memory)
+
+        yield crew_instance, crew
+
+        # Only reached when the run succeeded; a crew that raised mid-run is
+        # dropped rather than reused with half-updated task state
+        self._idle.put((crew_instance, crew))
+
+
+# Shared by the API worker and the CLI batch runner
+crew_pool = CrewPool()
+fast_crew_pool = CrewPool(fast=True)
+
+# CLI run and interactive mode keep memory across one user's runs
+memory_crew_pool = CrewPool(memory=True)
+fast_memory_crew_pool = CrewPool(fast=True, memory=True)
+
+
 # ============================================
 # PRODUCTION EXECUTION
 # ============================================
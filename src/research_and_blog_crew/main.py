@@ -15,20 +15,41 @@ It provides multiple execution modes for different production scenarios:
 
 import sys
 import os
+import atexit
+import queue
 import warnings
-import json
 import argparse
+import asyncio
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
-from research_and_blog_crew.crew import ResearchAndBlogCrew
+import orjson
+
+from research_and_blog_crew.crew import (
+    ResearchAndBlogCrew,
+    crew_pool,
+    fast_crew_pool,
+    fast_memory_crew_pool,
+    memory_crew_pool
+)
+from research_and_blog_crew.agent_cache import clear_agent_cache, enable_agent_cache
+from research_and_blog_crew.topics import iter_topics, topic_digest, unique_topics
 
 # Suppress specific warnings
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 warnings.filterwarnings("ignore", category=UserWarning)
 
+# uvloop's event loop schedules run()/batch() coroutines with less overhead;
+# it is not available on Windows, where the default loop is kept
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # ============================================
 # LOGGING CONFIGURATION
 # ============================================
@@ -37,15 +58,33 @@ warnings.filterwarnings("ignore", category=UserWarning)
 LOG_DIR = Path("logs")
 LOG_DIR.mkdir(exist_ok=True)
 
-# Configure logging with both file and console handlers
+# File and console handlers run on a background listener thread; crew threads
+# only enqueue records, so logging never blocks them on I/O or handler locks
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler(LOG_DIR / f'crew_execution_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, *_log_handlers, respect_handler_level=True)
+
+# The queue handler only merges args (and tracebacks) into the message;
+# the listener's handlers apply the real format
+_queue_handler = QueueHandler(log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+# force=True replaces the console handler crew.py installs on import
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_DIR / f'crew_execution_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[_queue_handler],
+    force=True
 )
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 # ============================================
@@ -59,7 +98,8 @@ OUTPUT_DIR.mkdir(exist_ok=True)
 # CORE EXECUTION FUNCTIONS
 # ============================================
 
-def run(topic: Optional[str] = None, save_metadata: bool = True) -> Dict:
+def run(topic: Optional[str] = None, save_metadata: bool = True, fast: bool = False,
+        memory: bool = True) -> Dict:
     """
     Run the crew for standard content generation.
     
@@ -71,6 +111,10 @@ def run(topic: Optional[str] = None, save_metadata: bool = True) -> Dict:
         topic (str, optional): Topic to research and write about. 
                               Defaults to 'What are AI Agents' if not provided.
         save_metadata (bool): Whether to save execution metadata. Default True.
+        fast (bool): Use the lean crew (research, report, blog; no QA phase).
+                     Default False.
+        memory (bool): Give the crew memory across runs. Default True;
+                       batch() turns it off so topics stay independent.
     
     Returns:
         Dict: Execution results and metadata
@@ -78,39 +122,56 @@ def run(topic: Optional[str] = None, save_metadata: bool = True) -> Dict:
     Example:
         >>> result = run(topic="Quantum Computing in 2024")
     """
+    return asyncio.run(run_async(topic=topic, save_metadata=save_metadata, fast=fast, memory=memory))
+
+
+async def run_async(topic: Optional[str] = None, save_metadata: bool = True, fast: bool = False,
+                    memory: bool = True) -> Dict:
+    """
+    Async variant of run() built on the crew's kickoff_async.
+    
+    Lets batch() drive many crews from one event loop. Takes the same
+    arguments and returns the same result as run().
+    """
     start_time = datetime.now()
     
     # Default topic if none provided
     if topic is None:
         topic = 'What are AI Agents in coding?'
     
+    # Every date in the inputs and metadata derives from start_time, so
+    # they cannot disagree with each other
     inputs = {
         'topic': topic,
-        'current_year': str(datetime.now().year),
-        'execution_date': datetime.now().strftime("%Y-%m-%d"),
-        'execution_time': datetime.now().strftime("%H:%M:%S")
+        'current_year': str(start_time.year),
+        'execution_date': start_time.strftime("%Y-%m-%d"),
+        'execution_time': start_time.strftime("%H:%M:%S")
     }
     
     logger.info("="*70)
     logger.info("RESEARCH AND BLOG CREW - PRODUCTION RUN")
     logger.info("="*70)
     logger.info(f"Topic: {topic}")
-    logger.info(f"Start Time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(f"Mode: {'fast' if fast else 'full'}")
+    logger.info(f"Start Time: {inputs['execution_date']} {inputs['execution_time']}")
     logger.info("="*70)
     
     try:
-        # Initialize and run crew
-        crew_instance = ResearchAndBlogCrew()
-        
-        # Display crew information
-        crew_info = crew_instance.get_crew_info()
-        logger.info(f"Agents: {crew_info['total_agents']}")
-        logger.info(f"Tasks: {crew_info['total_tasks']}")
-        logger.info(f"Phases: {len(crew_info['phases'])}")
-        logger.info("-"*70)
-        
-        # Execute crew
-        result = crew_instance.crew().kickoff(inputs=inputs)
+        # Reuse an idle crew from earlier runs (batch topics share them)
+        if memory:
+            pool = fast_memory_crew_pool if fast else memory_crew_pool
+        else:
+            pool = fast_crew_pool if fast else crew_pool
+        with pool.checkout() as (crew_instance, crew):
+            # Display crew information
+            crew_info = crew_instance.get_crew_info(fast=fast)
+            logger.info(f"Agents: {len(crew.agents)}")
+            logger.info(f"Tasks: {len(crew.tasks)}")
+            logger.info(f"Phases: {len(crew_info['phases'])}")
+            logger.info("-"*70)
+            
+            # Execute crew
+            result = await crew.kickoff_async(inputs=inputs)
         
         # Calculate execution time
         end_time = datetime.now()
@@ -119,6 +180,7 @@ def run(topic: Optional[str] = None, save_metadata: bool = True) -> Dict:
         # Prepare metadata
         metadata = {
             "topic": topic,
+            "mode": "fast" if fast else "full",
             "execution_date": inputs['execution_date'],
             "execution_time": inputs['execution_time'],
             "start_time": start_time.isoformat(),
@@ -131,9 +193,11 @@ def run(topic: Optional[str] = None, save_metadata: bool = True) -> Dict:
         
         # Save metadata if requested
         if save_metadata:
-            metadata_file = OUTPUT_DIR / f"metadata_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            metadata_file = OUTPUT_DIR / f"metadata_{end_time.strftime('%Y%m%d_%H%M%S_%f')}.json"
+            await asyncio.to_thread(
+                metadata_file.write_bytes,
+                orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+            )
             logger.info(f"Metadata saved to: {metadata_file}")
         
         logger.info("="*70)
@@ -149,6 +213,7 @@ def run(topic: Optional[str] = None, save_metadata: bool = True) -> Dict:
         }
         
     except Exception as e:
+        failed_at = datetime.now()
         logger.error("="*70)
         logger.error("EXECUTION FAILED")
         logger.error("="*70)
@@ -158,19 +223,23 @@ def run(topic: Optional[str] = None, save_metadata: bool = True) -> Dict:
         error_metadata = {
             "topic": topic,
             "execution_date": inputs['execution_date'],
+            "start_time": start_time.isoformat(),
+            "failed_at": failed_at.isoformat(),
             "status": "FAILED",
             "error": str(e),
             "error_type": type(e).__name__
         }
         
-        error_file = OUTPUT_DIR / f"error_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(error_file, 'w') as f:
-            json.dump(error_metadata, f, indent=2)
+        error_file = OUTPUT_DIR / f"error_{failed_at.strftime('%Y%m%d_%H%M%S_%f')}.json"
+        await asyncio.to_thread(
+            error_file.write_bytes,
+            orjson.dumps(error_metadata, option=orjson.OPT_INDENT_2)
+        )
         
         raise Exception(f"An error occurred while running the crew: {e}")
 
 
-def train(n_iterations: int, filename: str, topic: Optional[str] = None) -> None:
+def train(n_iterations: int, filename: str, topic: Optional[str] = None, use_agent_cache: bool = False) -> None:
     """
     Train the crew for improved performance over multiple iterations.
     
@@ -192,6 +261,9 @@ def train(n_iterations: int, filename: str, topic: Optional[str] = None) -> None
         n_iterations (int): Number of training iterations (recommended: 3-10)
         filename (str): Name of file to save training results
         topic (str, optional): Topic to train on. Defaults to "AI LLMs"
+        use_agent_cache (bool): Reuse agent outputs from earlier identical
+                                iterations instead of calling the LLM. Cached
+                                iterations record no new training data.
     
     Example:
         >>> train(n_iterations=5, filename="ai_training_results", topic="AI in Healthcare")
@@ -217,6 +289,11 @@ def train(n_iterations: int, filename: str, topic: Optional[str] = None) -> None
     logger.info("This may take a while depending on iterations.")
     logger.info("-"*70)
     
+    # Iterations repeat identical tasks; optionally reuse agent outputs
+    # instead of re-paying the LLM
+    if use_agent_cache:
+        enable_agent_cache()
+    
     try:
         ResearchAndBlogCrew().crew().train(
             n_iterations=n_iterations,
@@ -356,7 +433,7 @@ def test(n_iterations: int, eval_llm: str, topic: Optional[str] = None) -> None:
 # ADDITIONAL PRODUCTION FEATURES
 # ============================================
 
-def interactive() -> None:
+def interactive(fast: bool = True) -> None:
     """
     Interactive mode for dynamic topic input and execution.
     
@@ -365,7 +442,16 @@ def interactive() -> None:
     - Quick content generation
     - Testing different topics
     - Demo and presentation purposes
+    
+    Args:
+        fast (bool): Use the lean crew so each topic comes back sooner.
+                     Default True; pass False for the full pipeline with QA.
     """
+    # When piped (demos, CI), stdout is block-buffered and prompts would sit
+    # in the buffer; flush every line so the session reads like a terminal
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=True)
+    
     logger.info("="*70)
     logger.info("INTERACTIVE MODE")
     logger.info("="*70)
@@ -385,7 +471,7 @@ def interactive() -> None:
                 continue
             
             print(f"\n🚀 Generating content for: {topic}\n")
-            run(topic=topic)
+            run(topic=topic, fast=fast)
             print("\n✅ Content generation complete!\n")
             
         except KeyboardInterrupt:
@@ -396,11 +482,71 @@ def interactive() -> None:
             print(f"\n❌ Error: {str(e)}\n")
 
 
-def batch(topics_file: str) -> None:
+# Each crew is throttled to max_rpm=30 on its own, so the provider sees up to
+# BATCH_MAX_WORKERS * 30 requests per minute during a batch
+BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", "8"))
+
+
+async def _batch_async(topics: Iterable[str], total: int, max_workers: int, results_file) -> int:
+    """
+    Run topics through run_async with at most max_workers in flight.
+    
+    Topics are pulled from the iterable only when a slot frees up and each
+    result is appended to results_file as soon as it finishes, so crews,
+    results and topic text in memory stay proportional to max_workers
+    rather than to the number of topics (deduplication adds one small
+    digest per unique topic, see unique_topics).
+    
+    Returns:
+        int: Number of topics that completed successfully
+    """
+    done = 0
+    successful = 0
+    
+    async def process(topic: str) -> Dict:
+        try:
+            return {"topic": topic, "status": "SUCCESS", "result": await run_async(topic=topic, memory=False)}
+        except Exception as e:
+            return {"topic": topic, "status": "FAILED", "error": str(e)}
+    
+    async def record(status: Dict):
+        nonlocal done, successful
+        done += 1
+        if status["status"] == "SUCCESS":
+            successful += 1
+            logger.info(f"[{done}/{total}] Completed: {status['topic']}")
+        else:
+            logger.error(f"[{done}/{total}] Failed to process '{status['topic']}': {status['error']}")
+        # Writes happen off the event loop so running crews are not stalled
+        entry = (b"\n" if done == 1 else b",\n") + orjson.dumps(status, default=str)
+        await asyncio.to_thread(results_file.write, entry)
+    
+    # Crew runs are I/O-bound on LLM and search calls, so they overlap well
+    pending = set()
+    for topic in topics:
+        if len(pending) >= max(1, max_workers):
+            finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                await record(task.result())
+        pending.add(asyncio.create_task(process(topic)))
+    
+    while pending:
+        finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in finished:
+            await record(task.result())
+    
+    return successful
+
+
+def batch(topics_file: str, max_workers: int = BATCH_MAX_WORKERS) -> None:
     """
     Batch processing mode for multiple topics.
     
-    Reads topics from a file (one per line) and processes them sequentially.
+    Streams topics from a file (one per line) and processes them concurrently
+    on one event loop, each in its own crew, with at most `max_workers`
+    running at once. A failed topic is recorded and does not stop the rest
+    of the batch. Topics that differ only in case or whitespace are run
+    once. Results are written in completion order.
     Useful for:
     - Bulk content generation
     - Scheduled content creation
@@ -408,6 +554,7 @@ def batch(topics_file: str) -> None:
     
     Args:
         topics_file (str): Path to file containing topics (one per line)
+        max_workers (int): Maximum number of topics processed at once
     
     Example:
         Create a file 'topics.txt' with:
@@ -422,32 +569,30 @@ def batch(topics_file: str) -> None:
     logger.info("="*70)
     
     try:
-        with open(topics_file, 'r') as f:
-            topics = [line.strip() for line in f if line.strip()]
-        
-        total = len(topics)
-        logger.info(f"Found {total} topics to process")
+        # Counting is a cheap streaming pass; the topics themselves are read lazily below.
+        # Duplicates would cost a full crew run each, so only unique topics are processed.
+        listed = 0
+        digests = set()
+        for topic in iter_topics(topics_file):
+            listed += 1
+            digests.add(topic_digest(topic))
+        total = len(digests)
+        del digests
+        logger.info(f"Found {total} topics to process ({listed - total} duplicates skipped)")
         logger.info("-"*70)
         
-        results = []
-        for i, topic in enumerate(topics, 1):
-            logger.info(f"\n[{i}/{total}] Processing: {topic}")
-            try:
-                result = run(topic=topic)
-                results.append({"topic": topic, "status": "SUCCESS", "result": result})
-            except Exception as e:
-                logger.error(f"Failed to process '{topic}': {str(e)}")
-                results.append({"topic": topic, "status": "FAILED", "error": str(e)})
-        
-        # Save batch results
+        # Save batch results as they complete
         batch_file = OUTPUT_DIR / f"batch_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(batch_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(batch_file, 'wb') as f:
+            f.write(b"[")
+            successful = asyncio.run(
+                _batch_async(unique_topics(iter_topics(topics_file)), total, max_workers, f)
+            )
+            f.write(b"\n]\n")
         
         logger.info("="*70)
         logger.info("BATCH PROCESSING COMPLETED")
         logger.info("="*70)
-        successful = sum(1 for r in results if r["status"] == "SUCCESS")
         logger.info(f"Successful: {successful}/{total}")
         logger.info(f"Results saved to: {batch_file}")
         
@@ -463,6 +608,18 @@ def batch(topics_file: str) -> None:
 # COMMAND LINE INTERFACE
 # ============================================
 
+# Subcommand name -> handler taking the parsed arguments
+COMMANDS = {
+    'run': lambda args: run(topic=args.topic, fast=args.fast),
+    'train': lambda args: train(args.iterations, args.filename, args.topic, args.agent_cache),
+    'test': lambda args: test(args.iterations, args.eval_llm, args.topic),
+    'replay': lambda args: replay(args.task_id),
+    'interactive': lambda args: interactive(fast=not args.full),
+    'batch': lambda args: batch(args.file, args.workers),
+    'clear-agent-cache': lambda args: clear_agent_cache(),
+}
+
+
 def main():
     """
     Main entry point with argument parsing for different execution modes.
@@ -478,6 +635,9 @@ Examples:
   # Run with custom topic
   python main.py run --topic "Quantum Computing in 2024"
   
+  # Quick run without the QA phase
+  python main.py run --topic "Quantum Computing in 2024" --fast
+  
   # Train the crew
   python main.py train --iterations 5 --filename training_results
   
@@ -492,6 +652,9 @@ Examples:
   
   # Batch processing
   python main.py batch --file topics.txt
+  
+  # Drop cached agent outputs
+  python main.py clear-agent-cache
         """
     )
     
@@ -500,12 +663,14 @@ Examples:
     # Run command
     run_parser = subparsers.add_parser('run', help='Run content generation')
     run_parser.add_argument('--topic', type=str, help='Topic to research and write about')
+    run_parser.add_argument('--fast', action='store_true', help='Skip the QA phase (research, report and blog only)')
     
     # Train command
     train_parser = subparsers.add_parser('train', help='Train the crew')
     train_parser.add_argument('--iterations', type=int, required=True, help='Number of training iterations')
     train_parser.add_argument('--filename', type=str, required=True, help='Output filename for training results')
     train_parser.add_argument('--topic', type=str, help='Topic to train on')
+    train_parser.add_argument('--agent-cache', action='store_true', help='Reuse agent outputs from identical iterations (records no new training data for them)')
     
     # Test command
     test_parser = subparsers.add_parser('test', help='Test the crew')
@@ -518,30 +683,27 @@ Examples:
     replay_parser.add_argument('--task-id', type=str, required=True, help='Task ID to replay')
     
     # Interactive command
-    subparsers.add_parser('interactive', help='Interactive mode')
+    interactive_parser = subparsers.add_parser('interactive', help='Interactive mode')
+    interactive_parser.add_argument('--full', action='store_true', help='Run the full pipeline including QA (default is fast)')
     
     # Batch command
     batch_parser = subparsers.add_parser('batch', help='Batch process multiple topics')
     batch_parser.add_argument('--file', type=str, required=True, help='File containing topics')
+    batch_parser.add_argument('--workers', type=int, default=BATCH_MAX_WORKERS, help='Topics processed concurrently')
+    
+    # Clear agent cache command
+    subparsers.add_parser('clear-agent-cache', help='Drop cached agent outputs')
     
     args = parser.parse_args()
     
     # Execute appropriate command
+    handler = COMMANDS.get(args.command)
+    if handler is None:
+        parser.print_help()
+        return
+    
     try:
-        if args.command == 'run':
-            run(topic=args.topic if hasattr(args, 'topic') else None)
-        elif args.command == 'train':
-            train(args.iterations, args.filename, args.topic if hasattr(args, 'topic') else None)
-        elif args.command == 'test':
-            test(args.iterations, args.eval_llm, args.topic if hasattr(args, 'topic') else None)
-        elif args.command == 'replay':
-            replay(args.task_id)
-        elif args.command == 'interactive':
-            interactive()
-        elif args.command == 'batch':
-            batch(args.file)
-        else:
-            parser.print_help()
+        handler(args)
     except Exception as e:
         logger.error(f"Execution failed: {str(e)}")
         sys.exit(1)
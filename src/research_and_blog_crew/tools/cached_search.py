@@ -0,0 +1,204 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Any, ClassVar, Optional
+
+import numpy as np
+from cachetools import LRUCache
+from crewai_tools import SerperDevTool
+
+logger = logging.getLogger(__name__)
+
+
+# =========================================================
+# SEARCH RESULT CACHE
+# =========================================================
+
+def normalize_query(query: str) -> str:
+    """Lower-case and collapse whitespace so trivially different queries share an entry"""
+    return " ".join(query.lower().split())
+
+
+class SearchCache:
+    """
+    In-process cache for search results shared by every search tool.
+
+    Lookups try an exact match on the normalized query first. When the
+    optional semantic layer is enabled (sentence-transformers installed and
+    SEARCH_CACHE_SEMANTIC=true), a miss falls back to the closest cached
+    query by cosine similarity, so paraphrases reuse the same results.
+
+    Entries expire after `ttl` seconds; when full, the least frequently
+    used entry is evicted.
+    """
+
+    EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 3600,
+        similarity_threshold: float = 0.9,
+        semantic: bool = False
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.semantic = semantic
+        self._entries = {}  # key -> {"search_type", "response", "ts", "hits", "slot"}
+        self._lock = threading.Lock()
+        self._model = None
+
+        # Semantic index: one preallocated row per cache slot, so a lookup is a
+        # single matrix-vector product with no per-query stacking or copying
+        self._vectors = None  # (maxsize, dim) float32, allocated on first embedding
+        self._active = None  # (maxsize,) bool, rows holding a live entry
+        self._slot_keys = [None] * maxsize
+        self._free_slots = list(range(maxsize - 1, -1, -1))
+        # Embeddings computed by a missed get(), reused by the set() that follows
+        self._recent_embeddings = LRUCache(maxsize=256)
+
+    @staticmethod
+    def _key(query: str, search_type: str) -> str:
+        return hashlib.md5(f"{search_type}:{normalize_query(query)}".encode()).hexdigest()
+
+    def _embed(self, query: str):
+        """Unit-length float32 embedding of the query, or None when the semantic layer is off"""
+        if not self.semantic:
+            return None
+
+        normalized = normalize_query(query)
+        with self._lock:
+            embedding = self._recent_embeddings.get(normalized)
+        if embedding is not None:
+            return embedding
+
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                logger.warning("sentence-transformers not installed; semantic search cache disabled")
+                self.semantic = False
+                return None
+            self._model = SentenceTransformer(self.EMBEDDING_MODEL)
+
+        embedding = np.asarray(
+            self._model.encode(normalized, normalize_embeddings=True), dtype=np.float32
+        )
+        with self._lock:
+            self._recent_embeddings[normalized] = embedding
+        return embedding
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        slot = entry["slot"]
+        if slot is not None:
+            self._active[slot] = False
+            self._slot_keys[slot] = None
+            self._free_slots.append(slot)
+
+    def _expire(self, now: float):
+        expired = [key for key, entry in self._entries.items() if now - entry["ts"] > self.ttl]
+        for key in expired:
+            self._remove(key)
+
+    def get(self, query: str, search_type: str = "search") -> Optional[Any]:
+        """Return the cached response for the query, or None on a miss"""
+        key = self._key(query, search_type)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry["ts"] <= self.ttl:
+                entry["hits"] += 1
+                return entry["response"]
+
+        embedding = self._embed(query)
+        if embedding is None:
+            return None
+
+        with self._lock:
+            if self._vectors is None:
+                return None
+            self._expire(now)
+
+            scores = self._vectors @ embedding
+            scores[~self._active] = -1.0
+            matches = np.flatnonzero(scores >= self.similarity_threshold)
+            for slot in matches[np.argsort(-scores[matches])]:
+                entry = self._entries[self._slot_keys[slot]]
+                if entry["search_type"] == search_type:
+                    entry["hits"] += 1
+                    return entry["response"]
+            return None
+
+    def set(self, query: str, search_type: str, response: Any):
+        """Store a response, evicting the least frequently used entry when full"""
+        embedding = self._embed(query)
+        key = self._key(query, search_type)
+        now = time.time()
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if len(self._entries) >= self.maxsize:
+                self._expire(now)
+            if len(self._entries) >= self.maxsize:
+                coldest = min(self._entries, key=lambda k: self._entries[k]["hits"])
+                self._remove(coldest)
+
+            slot = None
+            if embedding is not None:
+                if self._vectors is None:
+                    self._vectors = np.zeros((self.maxsize, embedding.shape[0]), dtype=np.float32)
+                    self._active = np.zeros(self.maxsize, dtype=bool)
+                slot = self._free_slots.pop()
+                self._vectors[slot] = embedding
+                self._active[slot] = True
+                self._slot_keys[slot] = key
+
+            self._entries[key] = {
+                "search_type": search_type,
+                "response": response,
+                "ts": now,
+                "hits": 0,
+                "slot": slot
+            }
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+
+# One cache for the whole process, so overlapping queries from different
+# agents, tasks and crew runs are answered once
+search_cache = SearchCache(
+    maxsize=int(os.getenv("SEARCH_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("SEARCH_CACHE_TTL", "3600")),
+    semantic=os.getenv("SEARCH_CACHE_SEMANTIC", "false").lower() == "true"
+)
+
+
+# =========================================================
+# CACHED SERPER TOOL
+# =========================================================
+
+class CachedSerperTool(SerperDevTool):
+    """SerperDevTool that answers repeated (or, optionally, paraphrased) queries from search_cache"""
+
+    cache: ClassVar[SearchCache] = search_cache
+
+    def _run(self, **kwargs: Any) -> Any:
+        search_query = kwargs.get("search_query") or kwargs.get("query")
+        search_type = kwargs.get("search_type", self.search_type)
+
+        cached = self.cache.get(search_query, search_type)
+        if cached is not None:
+            return cached
+
+        results = super()._run(**kwargs)
+        self.cache.set(search_query, search_type, results)
+        return results
@@ -0,0 +1,49 @@
+"""
+Topic helpers for batch runs.
+
+Kept apart from main so they can be imported without main's setup
+(log handlers, output directories, event loop policy).
+"""
+
+import hashlib
+import logging
+import re
+from typing import Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+def iter_topics(topics_file: str) -> Iterator[str]:
+    """Yield non-empty, stripped lines from a topics file without reading it all into memory"""
+    with open(topics_file, 'r') as f:
+        for line in f:
+            topic = line.strip()
+            if topic:
+                yield topic
+
+
+def normalize_topic(topic: str) -> str:
+    """Case- and whitespace-insensitive form of a topic, used to spot duplicates"""
+    return re.sub(r"\s+", " ", topic.strip().lower())
+
+
+def topic_digest(topic: str) -> bytes:
+    """8-byte digest of the normalized topic; duplicate tracking keeps these, not the topics"""
+    return hashlib.blake2b(normalize_topic(topic).encode(), digest_size=8).digest()
+
+
+def unique_topics(topics: Iterable[str]) -> Iterator[str]:
+    """
+    Skip topics that normalize to one already seen, keeping the first spelling.
+    
+    Memory grows with the number of unique topics, but only by one small
+    digest each (under 100 bytes with set overhead), however long the topics are.
+    """
+    seen = set()
+    for topic in topics:
+        key = topic_digest(topic)
+        if key in seen:
+            logger.info(f"Skipping duplicate topic: {topic}")
+            continue
+        seen.add(key)
+        yield topic
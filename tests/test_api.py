@@ -1,12 +1,23 @@
 """
 Comprehensive API endpoint tests
 Run with: pytest tests/test_api.py -v
+
+The schema is created once per session; every test runs inside a
+transaction that is rolled back afterwards, so tests are independent
+and can run in any order.
 """
 
+import uuid
+from types import SimpleNamespace
+
+import fakeredis
+import orjson
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from redis.exceptions import RedisError
+from sqlalchemy import create_engine, event, inspect, text, update
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 import sys
 import os
 
@@ -16,36 +27,153 @@ os.environ["TESTING"] = "true"
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import api.idempotency
+import api.job_status
+import api.response_cache
+import api.server
+from api.response_cache import cached_response
 from api.server import app, get_db
-from database.models import Base
+from database.models import Base, ContentJob, User, _create_missing_indexes, hash_api_key
+from pydantic import ValidationError
+from research_and_blog_crew.crew import ResearchAndBlogCrew
+from research_and_blog_crew.topics import normalize_topic, unique_topics
+from research_and_blog_crew.tools.custom_tool import QueryInput, StringEchoTool, get_all_tools, get_tools_by_name
+from utils.rate_limit import sliding_window_hit
+import utils.logger
 
-# Test database setup
-TEST_DATABASE_URL = "sqlite:///./test.db"
-engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Test database setup: in-memory, so nothing touches the disk or needs cleanup
+TEST_DATABASE_URL = "sqlite://"
+TEST_PASSWORD = "test-password-123"
 
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
+# ============================================
+# FIXTURES
+# ============================================
 
-app.dependency_overrides[get_db] = override_get_db
+@pytest.fixture(scope="session")
+def engine():
+    """Create the test schema once for the whole session"""
+    # StaticPool hands every session the same connection, i.e. the same in-memory database
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
 
-# Create test database
-Base.metadata.drop_all(bind=engine)  # Clear any existing data
-Base.metadata.create_all(bind=engine)
+    # pysqlite starts transactions lazily and ignores SAVEPOINTs without
+    # this; let SQLAlchemy emit BEGIN itself (see the SQLAlchemy SQLite docs)
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
 
-client = TestClient(app)
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
-# ============================================
-# SHARED TEST DATA (Module Level)
-# ============================================
+    Base.metadata.create_all(bind=engine)
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """A session whose work is rolled back when the test ends, even after commit()"""
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+
+    def override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield session
+
+    app.dependency_overrides.pop(get_db, None)
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(autouse=True)
+def no_crew_runs(monkeypatch):
+    """Accept /generate jobs without kicking off a real crew"""
+    monkeypatch.setattr(api.server, "run_crew", lambda job_id, topic, user_id: None)
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    """Back the Redis code paths with an in-memory fakeredis server"""
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(api.server, "get_redis", lambda: client)
+    monkeypatch.setattr(api.idempotency, "get_redis", lambda: client)
+    monkeypatch.setattr(api.job_status, "get_redis", lambda: client)
+    # Persisting usage_count opens its own production session; the
+    # database path is covered by the tests that run without Redis
+    monkeypatch.setattr(api.server, "record_usage", lambda user_id: None)
+    return client
+
+
+@pytest.fixture
+def rate_limited(monkeypatch):
+    """Enforce the hourly rate limit, which is otherwise skipped in testing mode"""
+    monkeypatch.setattr(api.server, "TESTING", False)
+
+
+@pytest.fixture
+def client(db_session):
+    return TestClient(app)
+
+
+def set_usage_count(db_session, api_key, usage_count):
+    db_session.execute(
+        update(User)
+        .where(User.api_key_hash == hash_api_key(api_key))
+        .values(usage_count=usage_count)
+    )
 
-TEST_USER_EMAIL = "test_user@example.com"
-TEST_USER_API_KEY = None
-TEST_JOB_ID = None
+
+def generate(client, api_key, topic="AI in Healthcare", idempotency_key=None):
+    headers = {"X-API-Key": api_key}
+    if idempotency_key:
+        headers["Idempotency-Key"] = idempotency_key
+    return client.post("/generate", json={"topic": topic}, headers=headers)
+
+
+def user_id(db_session, api_key):
+    return db_session.query(User.id).filter(User.api_key_hash == hash_api_key(api_key)).scalar()
+
+
+def fail_redis(*args, **kwargs):
+    raise RedisError("connection refused")
+
+
+def signup(client, email=None):
+    """Sign up a user with a unique email unless one is given"""
+    return client.post(
+        "/signup",
+        json={
+            "email": email or f"user_{uuid.uuid4().hex[:12]}@example.com",
+            "password": TEST_PASSWORD
+        }
+    )
+
+
+@pytest.fixture
+def api_key(client):
+    response = signup(client)
+    assert response.status_code == 200
+    return response.json()["api_key"]
+
+
+@pytest.fixture
+def job_id(client, api_key):
+    response = client.post(
+        "/generate",
+        json={"topic": "AI in Healthcare"},
+        headers={"X-API-Key": api_key}
+    )
+    assert response.status_code == 200
+    return response.json()["job_id"]
 
 # ============================================
 # TEST CLASSES
@@ -53,58 +181,34 @@ TEST_JOB_ID = None
 
 class TestAuthentication:
     """Test authentication and user management"""
-    
-    def test_01_signup_success(self):
+
+    def test_signup_success(self, client):
         """Test successful user signup"""
-        global TEST_USER_API_KEY
-        
-        response = client.post(
-            "/signup",
-            json={"email": TEST_USER_EMAIL}
-        )
+        response = signup(client, "test_user@example.com")
         assert response.status_code == 200
         data = response.json()
         assert "api_key" in data
-        assert data["email"] == TEST_USER_EMAIL
+        assert data["email"] == "test_user@example.com"
         assert data["subscription_tier"] == "free"
-        
-        # Store API key for other tests
-        TEST_USER_API_KEY = data["api_key"]
-        print(f"\n✅ Created test user with API key: {TEST_USER_API_KEY[:20]}...")
-    
-    def test_02_signup_duplicate_email(self):
+
+    def test_signup_duplicate_email(self, client):
         """Test signup with duplicate email fails"""
-        response = client.post(
-            "/signup",
-            json={"email": TEST_USER_EMAIL}
-        )
+        assert signup(client, "test_user@example.com").status_code == 200
+
+        response = signup(client, "test_user@example.com")
         assert response.status_code == 400
         assert "already registered" in response.json()["detail"].lower()
-    
-    def test_03_signup_invalid_email(self):
+
+    def test_signup_invalid_email(self, client):
         """Test signup with invalid email fails"""
-        response = client.post(
-            "/signup",
-            json={"email": "not-an-email"}
-        )
+        response = signup(client, "not-an-email")
         assert response.status_code == 422  # Validation error
-    
-    def test_04_signup_new_user(self):
-        """Test creating another user works"""
-        response = client.post(
-            "/signup",
-            json={"email": "another_user@example.com"}
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "api_key" in data
-        print(f"✅ Created another user: {data['email']}")
 
 
 class TestContentGeneration:
     """Test content generation endpoints"""
-    
-    def test_01_generate_without_auth(self):
+
+    def test_generate_without_auth(self, client):
         """Test generate endpoint without API key fails"""
         response = client.post(
             "/generate",
@@ -112,8 +216,8 @@ class TestContentGeneration:
         )
         assert response.status_code == 401
         assert "API Key required" in response.json()["detail"]
-    
-    def test_02_generate_with_invalid_api_key(self):
+
+    def test_generate_with_invalid_api_key(self, client):
         """Test generate endpoint with invalid API key fails"""
         response = client.post(
             "/generate",
@@ -122,123 +226,325 @@ class TestContentGeneration:
         )
         assert response.status_code == 403
         assert "Invalid API Key" in response.json()["detail"]
-    
-    def test_03_generate_success(self):
+
+    def test_generate_success(self, client, api_key):
         """Test successful content generation"""
-        global TEST_JOB_ID
-        
-        assert TEST_USER_API_KEY is not None, "Test user must be created first"
-        
         response = client.post(
             "/generate",
             json={"topic": "AI in Healthcare"},
-            headers={"X-API-Key": TEST_USER_API_KEY}
+            headers={"X-API-Key": api_key}
         )
-        
-        print(f"\n📝 Generate response status: {response.status_code}")
-        print(f"📝 Generate response: {response.json()}")
-        
+
         assert response.status_code == 200
         data = response.json()
         assert "job_id" in data
         assert data["status"] == "processing"
         assert "usage" in data
-        
-        # Store job_id for other tests
-        TEST_JOB_ID = data["job_id"]
-        print(f"✅ Generated job_id: {TEST_JOB_ID}")
-    
-    def test_04_generate_empty_topic(self):
+
+    def test_generate_empty_topic(self, client, api_key):
         """Test generate with empty topic fails"""
-        assert TEST_USER_API_KEY is not None, "Test user must be created first"
-        
         response = client.post(
             "/generate",
             json={"topic": ""},
-            headers={"X-API-Key": TEST_USER_API_KEY}
+            headers={"X-API-Key": api_key}
         )
         assert response.status_code == 400
         assert "empty" in response.json()["detail"].lower()
-    
-    def test_05_generate_too_long_topic(self):
+
+    def test_generate_too_long_topic(self, client, api_key):
         """Test generate with too long topic fails"""
-        assert TEST_USER_API_KEY is not None, "Test user must be created first"
-        
         long_topic = "A" * 201  # 201 characters
         response = client.post(
             "/generate",
             json={"topic": long_topic},
-            headers={"X-API-Key": TEST_USER_API_KEY}
+            headers={"X-API-Key": api_key}
         )
         assert response.status_code == 400
         assert "200 characters" in response.json()["detail"].lower()
-    
-    def test_06_status_check(self):
+
+    def test_status_check(self, client, api_key, job_id):
         """Test job status endpoint"""
-        assert TEST_USER_API_KEY is not None, "Test user must be created first"
-        assert TEST_JOB_ID is not None, "Job must be created first"
-        
         response = client.get(
-            f"/status/{TEST_JOB_ID}",
-            headers={"X-API-Key": TEST_USER_API_KEY}
+            f"/status/{job_id}",
+            headers={"X-API-Key": api_key}
         )
-        
-        print(f"\n📊 Status response: {response.json()}")
-        
+
         assert response.status_code == 200
         data = response.json()
-        assert data["job_id"] == TEST_JOB_ID
+        assert data["job_id"] == job_id
         assert "status" in data
         assert data["status"] in ["processing", "completed", "failed"]
-    
-    def test_07_status_check_invalid_job(self):
+
+    def test_status_check_cached_in_redis(self, client, db_session, redis_client, api_key, job_id):
+        """A finished job's status round-trips through the Redis cache"""
+        job = db_session.query(ContentJob).filter(ContentJob.job_id == job_id).one()
+        job.status = "failed"
+        job.error_message = "crew failed"
+        api.job_status.cache_job_status(job)
+
+        cached = api.job_status.get_cached_job_status(job.user_id, job_id)
+        assert cached == api.job_status.job_status_payload(job)
+
+        response = client.get(f"/status/{job_id}", headers={"X-API-Key": api_key})
+        assert response.json() == cached
+
+    def test_status_check_invalid_job(self, client, api_key):
         """Test status check with invalid job_id"""
-        assert TEST_USER_API_KEY is not None, "Test user must be created first"
-        
         response = client.get(
             "/status/invalid-job-id-12345",
-            headers={"X-API-Key": TEST_USER_API_KEY}
+            headers={"X-API-Key": api_key}
         )
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
-    
-    def test_08_status_check_without_auth(self):
+
+    def test_status_check_without_auth(self, client, job_id):
         """Test status check without authentication"""
-        assert TEST_JOB_ID is not None, "Job must be created first"
-        
-        response = client.get(f"/status/{TEST_JOB_ID}")
+        response = client.get(f"/status/{job_id}")
         assert response.status_code == 401
 
 
+class TestIdempotency:
+    """Test Idempotency-Key handling on /generate"""
+
+    def test_replay_returns_original_response(self, client, api_key):
+        """A retry gets the first response back without using quota"""
+        key = uuid.uuid4().hex
+        first = generate(client, api_key, idempotency_key=key)
+        assert first.status_code == 200
+
+        replay = generate(client, api_key, idempotency_key=key)
+        assert replay.status_code == 200
+        assert replay.headers["Idempotent-Replay"] == "true"
+        assert replay.json() == first.json()
+
+        usage = client.get("/usage", headers={"X-API-Key": api_key}).json()
+        assert usage["usage_count"] == 1
+
+    def test_replay_with_redis(self, client, redis_client, api_key):
+        """Replays work the same when keys are held in Redis"""
+        key = uuid.uuid4().hex
+        first = generate(client, api_key, idempotency_key=key)
+        replay = generate(client, api_key, idempotency_key=key)
+        assert replay.headers["Idempotent-Replay"] == "true"
+        assert replay.json() == first.json()
+
+    def test_concurrent_claim_conflicts(self, client, db_session, api_key):
+        """A retry while the first request is still running gets 409"""
+        key = uuid.uuid4().hex
+        assert api.idempotency.claim_idempotency_key(user_id(db_session, api_key), key) is None
+
+        response = generate(client, api_key, idempotency_key=key)
+        assert response.status_code == 409
+
+    def test_pending_claim_expires_early(self, client, db_session, api_key, monkeypatch):
+        """An abandoned claim stops blocking retries long before a stored response expires"""
+        key = uuid.uuid4().hex
+        uid = user_id(db_session, api_key)
+        now = 1000.0
+        monkeypatch.setattr(api.idempotency.time, "monotonic", lambda: now)
+        assert api.idempotency.claim_idempotency_key(uid, key) is None
+
+        now += api.idempotency.IDEMPOTENCY_PENDING_TTL_SECONDS
+        assert api.idempotency.claim_idempotency_key(uid, key) is None
+
+        api.idempotency.store_idempotent_response(uid, key, {"job_id": "abc"})
+        now += api.idempotency.IDEMPOTENCY_PENDING_TTL_SECONDS
+        assert api.idempotency.claim_idempotency_key(uid, key) == '{"job_id":"abc"}'
+
+    def test_pending_claim_ttl_with_redis(self, db_session, redis_client, api_key):
+        """In Redis a claim gets the short TTL and a stored response the long one"""
+        key = uuid.uuid4().hex
+        uid = user_id(db_session, api_key)
+        cache_key = api.idempotency._cache_key(uid, key)
+
+        assert api.idempotency.claim_idempotency_key(uid, key) is None
+        assert redis_client.ttl(cache_key) <= api.idempotency.IDEMPOTENCY_PENDING_TTL_SECONDS
+
+        api.idempotency.store_idempotent_response(uid, key, {"job_id": "abc"})
+        assert redis_client.ttl(cache_key) > api.idempotency.IDEMPOTENCY_PENDING_TTL_SECONDS
+
+    def test_claim_released_when_enqueue_fails(self, client, api_key, monkeypatch):
+        """A request whose crew was never queued can be retried with the same key"""
+        key = uuid.uuid4().hex
+
+        async def fail_enqueue(*args):
+            raise RuntimeError("queue unavailable")
+
+        with monkeypatch.context() as m:
+            m.setattr(api.server, "enqueue_crew", fail_enqueue)
+            with pytest.raises(RuntimeError):
+                generate(client, api_key, idempotency_key=key)
+
+        response = generate(client, api_key, idempotency_key=key)
+        assert response.status_code == 200
+        assert "Idempotent-Replay" not in response.headers
+
+
 class TestUsageTracking:
     """Test usage tracking and limits"""
-    
-    def test_01_usage_endpoint(self):
+
+    def test_usage_endpoint(self, client):
         """Test usage statistics endpoint"""
-        assert TEST_USER_API_KEY is not None, "Test user must be created first"
-        
+        response = signup(client, "usage_user@example.com")
+        api_key = response.json()["api_key"]
+
         response = client.get(
             "/usage",
-            headers={"X-API-Key": TEST_USER_API_KEY}
+            headers={"X-API-Key": api_key}
         )
         assert response.status_code == 200
         data = response.json()
         assert "usage_count" in data
         assert "monthly_limit" in data
         assert "remaining" in data
-        assert data["email"] == TEST_USER_EMAIL
-        print(f"\n📊 Usage: {data['usage_count']}/{data['monthly_limit']}")
-    
-    def test_02_usage_without_auth(self):
+        assert data["email"] == "usage_user@example.com"
+
+    def test_usage_without_auth(self, client):
         """Test usage endpoint without authentication"""
         response = client.get("/usage")
         assert response.status_code == 401
 
 
+class TestRateLimiting:
+    """Test the hourly rate limit with and without Redis (free tier: 2 per hour)"""
+
+    def test_rate_limit_database(self, client, rate_limited, api_key):
+        """Without Redis, recent jobs are counted in the database"""
+        assert generate(client, api_key).status_code == 200
+        assert generate(client, api_key).status_code == 200
+
+        response = generate(client, api_key)
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == str(api.server.RATE_LIMIT_WINDOW_SECONDS)
+
+    def test_rate_limit_redis(self, client, db_session, rate_limited, redis_client, api_key):
+        """With Redis, requests are counted in a sliding window"""
+        assert generate(client, api_key).status_code == 200
+        assert generate(client, api_key).status_code == 200
+
+        response = generate(client, api_key)
+        assert response.status_code == 429
+        assert 0 < int(response.headers["Retry-After"]) <= api.server.RATE_LIMIT_WINDOW_SECONDS
+        assert redis_client.zcard(f"ratelimit:user:{user_id(db_session, api_key)}") == 2
+
+    def test_rate_limit_redis_refunded_when_quota_rejects(self, client, db_session, rate_limited, redis_client, api_key):
+        """A request turned away by the monthly quota leaves no slot in the window"""
+        set_usage_count(db_session, api_key, 10)
+
+        assert generate(client, api_key).status_code == 429
+        assert redis_client.zcard(f"ratelimit:user:{user_id(db_session, api_key)}") == 0
+
+    def test_rate_limit_redis_refunded_when_job_insert_fails(self, client, db_session, rate_limited, redis_client, api_key, monkeypatch):
+        """A request whose job was never created leaves no slot in the window"""
+        generate(client, api_key)
+
+        def fail_commit():
+            raise RuntimeError("database unavailable")
+
+        with monkeypatch.context() as m:
+            m.setattr(db_session, "commit", fail_commit)
+            with pytest.raises(RuntimeError):
+                generate(client, api_key)
+
+        assert redis_client.zcard(f"ratelimit:user:{user_id(db_session, api_key)}") == 1
+        assert generate(client, api_key).status_code == 200
+
+    def test_rate_limit_redis_unavailable_falls_back_to_database(self, client, rate_limited, redis_client, api_key, monkeypatch):
+        """A Redis outage falls back to counting jobs in the database"""
+        monkeypatch.setattr(redis_client, "evalsha", fail_redis)
+
+        assert generate(client, api_key).status_code == 200
+        assert generate(client, api_key).status_code == 200
+        assert generate(client, api_key).status_code == 429
+
+    def test_sliding_window(self, monkeypatch):
+        """Requests leave the window one at a time as they age out"""
+        redis_client = fakeredis.FakeRedis(decode_responses=True)
+        now = [1000.0]
+        monkeypatch.setattr("utils.rate_limit.time.time", lambda: now[0])
+
+        assert sliding_window_hit(redis_client, "window", 2, 10) == (True, 1, 0)
+        now[0] += 1
+        assert sliding_window_hit(redis_client, "window", 2, 10) == (True, 2, 0)
+        now[0] += 4
+        assert sliding_window_hit(redis_client, "window", 2, 10) == (False, 2, 5)
+
+        # The first request has aged out, the second has not
+        now[0] += 5.5
+        assert sliding_window_hit(redis_client, "window", 2, 10) == (True, 2, 0)
+        assert sliding_window_hit(redis_client, "window", 2, 10)[0] is False
+
+
+class TestMonthlyQuota:
+    """Test the monthly quota with and without Redis"""
+
+    def test_quota_database(self, client, db_session, api_key):
+        """Without Redis the quota is enforced against usage_count"""
+        set_usage_count(db_session, api_key, 9)
+
+        response = generate(client, api_key)
+        assert response.status_code == 200
+        assert response.json()["usage"] == "10/10"
+
+        usage = client.get("/usage", headers={"X-API-Key": api_key}).json()
+        assert usage["usage_count"] == 10
+        assert usage["remaining"] == 0
+
+        assert generate(client, api_key).status_code == 429
+
+    def test_quota_redis_seeded_from_usage_count(self, client, db_session, redis_client, api_key):
+        """An existing user's Redis counter starts from their usage_count"""
+        set_usage_count(db_session, api_key, 9)
+
+        response = generate(client, api_key)
+        assert response.status_code == 200
+        assert response.json()["usage"] == "10/10"
+
+        usage = client.get("/usage", headers={"X-API-Key": api_key}).json()
+        assert usage["usage_count"] == 10
+        assert usage["remaining"] == 0
+
+        assert generate(client, api_key).status_code == 429
+
+    def test_quota_redis_matches_usage(self, client, redis_client, api_key):
+        """/generate and /usage report the same count"""
+        generate(client, api_key)
+        response = generate(client, api_key)
+        assert response.json()["usage"] == "2/10"
+
+        usage = client.get("/usage", headers={"X-API-Key": api_key}).json()
+        assert usage["usage_count"] == 2
+        assert usage["remaining"] == 8
+
+    def test_quota_redis_refunded_when_job_insert_fails(self, client, db_session, redis_client, api_key, monkeypatch):
+        """A request whose job was never created does not count"""
+        generate(client, api_key)
+
+        def fail_commit():
+            raise RuntimeError("database unavailable")
+
+        with monkeypatch.context() as m:
+            m.setattr(db_session, "commit", fail_commit)
+            with pytest.raises(RuntimeError):
+                generate(client, api_key)
+
+        usage = client.get("/usage", headers={"X-API-Key": api_key}).json()
+        assert usage["usage_count"] == 1
+
+    def test_quota_redis_unavailable_falls_back_to_database(self, client, db_session, redis_client, api_key, monkeypatch):
+        """A Redis outage falls back to usage_count instead of failing"""
+        monkeypatch.setattr(redis_client, "evalsha", fail_redis)
+        monkeypatch.setattr(redis_client, "get", fail_redis)
+        set_usage_count(db_session, api_key, 10)
+
+        assert generate(client, api_key).status_code == 429
+        assert client.get("/usage", headers={"X-API-Key": api_key}).json()["usage_count"] == 10
+
+
 class TestSystemEndpoints:
     """Test system and admin endpoints"""
-    
-    def test_01_health_check(self):
+
+    def test_health_check(self, client):
         """Test health check endpoint (no auth required)"""
         response = client.get("/health")
         assert response.status_code == 200
@@ -246,9 +552,8 @@ class TestSystemEndpoints:
         assert "status" in data
         assert "timestamp" in data
         assert data["status"] in ["healthy", "degraded"]
-        print(f"\n💚 Health: {data['status']}")
-    
-    def test_02_admin_stats(self):
+
+    def test_admin_stats(self, client):
         """Test admin statistics endpoint"""
         response = client.get("/admin/stats")
         assert response.status_code == 200
@@ -256,69 +561,244 @@ class TestSystemEndpoints:
         assert "total_users" in data
         assert "total_jobs" in data
         assert "success_rate" in data
-        print(f"\n📊 Platform stats: {data}")
-    
-    def test_03_admin_costs(self):
+
+    def test_admin_costs(self, client):
         """Test admin cost analytics endpoint"""
         response = client.get("/admin/costs")
         assert response.status_code == 200
         data = response.json()
         assert "total_cost" in data
         assert "avg_cost_per_job" in data
-        print(f"\n💰 Costs: {data}")
+
+    def test_admin_users_pagination(self, client):
+        """Test admin user list pages with a keyset cursor"""
+        signup(client)
+        signup(client)
+
+        response = client.get("/admin/users", params={"limit": 1})
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["users"]) == 1
+        assert data["next_cursor"] == data["users"][0]["id"]
+
+        next_page = client.get("/admin/users", params={"limit": 1, "cursor": data["next_cursor"]}).json()
+        assert all(u["id"] > data["next_cursor"] for u in next_page["users"])
+
+
+class TestDatabase:
+    """Test schema upgrades of existing databases"""
+
+    def test_missing_indexes_are_created(self):
+        """Indexes added after a database was created are added on init"""
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            # content_jobs as created by the first release
+            conn.execute(text(
+                "CREATE TABLE content_jobs (id INTEGER PRIMARY KEY, job_id VARCHAR NOT NULL, "
+                "user_id INTEGER NOT NULL, topic VARCHAR NOT NULL, status VARCHAR, created_at DATETIME)"
+            ))
+            _create_missing_indexes(conn)
+            _create_missing_indexes(conn)  # idempotent
+
+        indexes = {index["name"] for index in inspect(engine).get_indexes("content_jobs")}
+        assert {
+            "ix_content_jobs_user_id",
+            "ix_content_jobs_status",
+            "ix_content_jobs_created_at",
+            "ix_job_user_job"
+        } <= indexes
+        engine.dispose()
+
+
+class TestTools:
+    """Test custom tool argument handling"""
+
+    def test_tool_rejects_extra_arguments(self):
+        """Arguments outside the tool's schema are rejected"""
+        tool = StringEchoTool(
+            name="web_search_tool",
+            description="Search the web.",
+            args_schema=QueryInput,
+            template="Web search results for: {query}"
+        )
+        assert tool.run(query="AI") == "Web search results for: AI"
+
+        with pytest.raises(ValidationError):
+            tool.run(query="AI", extra=1)
+
+    def test_registry_follows_testing_flag(self, monkeypatch):
+        """The registry is empty under TESTING, even after it was built"""
+        assert get_all_tools() == ()
+
+        monkeypatch.setenv("TESTING", "false")
+        assert len(get_all_tools()) == 11
+        assert "web_search_tool" in get_tools_by_name()
+
+        monkeypatch.setenv("TESTING", "true")
+        assert get_all_tools() == ()
+        assert len(get_tools_by_name()) == 0
+
+
+class TestCrewAssembly:
+    """Test the crew's agent wiring"""
+
+    def test_copy_keeps_distinct_research_agents(self, monkeypatch):
+        """Copies map agents back by role, so each parallel research task keeps its own analyst"""
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        crew_base = ResearchAndBlogCrew()
+        copied = crew_base.crew(memory=False).copy()
+
+        research_agents = {id(task.agent) for task in copied.tasks if task.async_execution}
+        assert len(research_agents) == 4
+        assert crew_base.get_crew_info()["total_agents"] == len(copied.agents) == 7
+
+
+class TestResponseCaching:
+    """Test the cached /admin aggregates and /health"""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """A response-cache clock that only moves when a test advances it"""
+        now = [1000.0]
+        monkeypatch.setattr(api.response_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+        return now
+
+    def test_admin_stats_hit_and_miss(self, client):
+        """A repeat request within the TTL is served from the cache"""
+        api.server.admin_stats.cache_clear()
+
+        first = client.get("/admin/stats")
+        assert first.headers["X-Cache"] == "miss"
+
+        second = client.get("/admin/stats")
+        assert second.headers["X-Cache"] == "hit"
+        assert second.json() == first.json()
+
+    def test_cache_expires(self, clock):
+        """Entries are recomputed once the TTL has passed"""
+        calls = []
+
+        @cached_response(ttl=30)
+        def endpoint():
+            calls.append(1)
+            return {"calls": len(calls)}
+
+        assert endpoint().headers["X-Cache"] == "miss"
+        clock[0] += 29
+        assert endpoint().headers["X-Cache"] == "hit"
+        clock[0] += 2
+        response = endpoint()
+        assert response.headers["X-Cache"] == "miss"
+        assert orjson.loads(response.body) == {"calls": 2}
+
+    def test_cache_serves_stale_on_error(self, clock):
+        """A failed recompute serves the last good body instead of an error"""
+        fail = [False]
+
+        @cached_response(ttl=30)
+        def endpoint():
+            if fail[0]:
+                raise RuntimeError("database unavailable")
+            return {"ok": True}
+
+        endpoint()
+        clock[0] += 31
+        fail[0] = True
+        response = endpoint()
+        assert response.headers["X-Cache"] == "stale"
+        assert orjson.loads(response.body) == {"ok": True}
+
+    def test_cache_key_ignores_session(self, clock):
+        """Entries are keyed by query parameters, not by the database session"""
+        calls = []
+
+        @cached_response(ttl=30)
+        def endpoint(days: int = 7, db: Session = None):
+            calls.append(days)
+            return {"days": days}
+
+        assert endpoint(days=7, db=Session()).headers["X-Cache"] == "miss"
+        assert endpoint(days=7, db=Session()).headers["X-Cache"] == "hit"
+        assert endpoint(days=30, db=Session()).headers["X-Cache"] == "miss"
+        assert calls == [7, 30]
+
+    def test_health_cached_until_expiry(self, client, monkeypatch):
+        """/health reuses its body for HEALTH_CACHE_SECONDS, then rebuilds it"""
+        monkeypatch.setattr(api.server, "_cached_health", (float("-inf"), b""))
+
+        first = client.get("/health")
+        assert client.get("/health").content == first.content
+
+        # Age the cached body past the TTL
+        built_at, body = api.server._cached_health
+        expired_at = built_at - api.server.HEALTH_CACHE_SECONDS
+        monkeypatch.setattr(api.server, "_cached_health", (expired_at, body))
+
+        assert client.get("/health").status_code == 200
+        assert api.server._cached_health[0] > expired_at
+
+
+class TestBatchTopics:
+    """Test topic deduplication for batch runs"""
+
+    def test_normalize_topic(self):
+        """Case and whitespace differences normalize away"""
+        assert normalize_topic("  AI in\tHealthcare  ") == "ai in healthcare"
+        assert normalize_topic("Quantum  Computing") == normalize_topic("quantum computing")
+
+    def test_unique_topics_keeps_first_spelling(self):
+        """Duplicates are skipped lazily, in order, keeping the first spelling"""
+        topics = ["AI in Healthcare", "Quantum Computing", "ai  in healthcare", "AI in Finance"]
+        assert list(unique_topics(iter(topics))) == ["AI in Healthcare", "Quantum Computing", "AI in Finance"]
+
+
+class TestLogging:
+    """Test the structured JSON log file"""
+
+    def test_exception_keeps_exc_info(self, monkeypatch, tmp_path):
+        """logger.exception writes its traceback to the JSON line's exc_info field"""
+        monkeypatch.setattr(utils.logger, "LOG_DIR", tmp_path)
+        name = f"test-{uuid.uuid4().hex}"
+        logger = utils.logger.setup_logger(name, "test.log")
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Job %s failed", 42, extra={"job_id": 42})
+        # Stopping the listener drains the queue into the file
+        utils.logger._listeners.pop(name).stop()
+
+        line = orjson.loads((tmp_path / "test.log").read_text().splitlines()[-1])
+        assert line["message"] == "Job 42 failed"
+        assert line["job_id"] == 42
+        assert "ValueError: boom" in line["exc_info"]
 
 
 class TestErrorHandling:
     """Test error handling and edge cases"""
-    
-    def test_01_invalid_endpoint(self):
+
+    def test_invalid_endpoint(self, client):
         """Test non-existent endpoint returns 404"""
         response = client.get("/nonexistent-endpoint")
         assert response.status_code == 404
-    
-    def test_02_invalid_http_method(self):
+
+    def test_invalid_http_method(self, client):
         """Test invalid HTTP method"""
         response = client.get("/generate")  # Should be POST
         assert response.status_code == 405
-    
-    def test_03_malformed_json(self):
+
+    def test_malformed_json(self, client, api_key):
         """Test malformed JSON body"""
-        assert TEST_USER_API_KEY is not None, "Test user must be created first"
-        
         response = client.post(
             "/generate",
-            data="this is not json",  # Invalid JSON
+            content="this is not json",  # Invalid JSON
             headers={
-                "X-API-Key": TEST_USER_API_KEY,
+                "X-API-Key": api_key,
                 "Content-Type": "application/json"
             }
         )
         assert response.status_code == 422
 
 
-# ============================================
-# PYTEST CONFIGURATION
-# ============================================
-
-@pytest.fixture(scope="session", autouse=True)
-def cleanup(request):
-    """Cleanup test database after all tests"""
-    def remove_test_db():
-        import os
-        if os.path.exists("test.db"):
-            os.remove("test.db")
-            print("\n🗑️  Cleaned up test database")
-    
-    request.addfinalizer(remove_test_db)
-
-
-def pytest_configure(config):
-    """Configure pytest"""
-    # Ensure tests run in order
-    config.addinivalue_line(
-        "markers", "order: mark test execution order"
-    )
-
-
 if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
\ No newline at end of file
+    pytest.main([__file__, "-v", "--tb=short"])
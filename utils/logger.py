@@ -1,21 +1,101 @@
+import atexit
+import copy
 import logging
+import queue
 import sys
-from pythonjsonlogger import jsonlogger
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import orjson
+from pythonjsonlogger.core import merge_record_extra
+from pythonjsonlogger.orjson import OrjsonFormatter
 from pathlib import Path
 from datetime import datetime
 
+LOG_DIR = Path("logs")
+LOG_DIR.mkdir(exist_ok=True)
+
+# Rotate so log files stay small enough to live in the page cache
+LOG_MAX_BYTES = 50_000_000
+LOG_BACKUP_COUNT = 5
+
+# Loggers already set up by setup_logger, by name
+_configured = {}
+
+# Background listeners that own each logger's console/file handlers
+_listeners = {}
+
+def _stop_listeners():
+    for listener in _listeners.values():
+        listener.stop()
+
+atexit.register(_stop_listeners)
+
+class JsonLogFormatter(OrjsonFormatter):
+    """
+    JSON formatter for the log files, with the line's fields fixed in code
+    
+    Fills timestamp, level, name and message straight from the record
+    instead of going through a parsed format string and rename map, then
+    merges any extra= fields and serializes with orjson.
+    """
+    FIELDS = ("timestamp", "level", "name", "message")
+    
+    def __init__(self, datefmt='%Y-%m-%d %H:%M:%S'):
+        super().__init__(list(self.FIELDS), datefmt=datefmt)
+    
+    def add_fields(self, log_data, record, message_dict):
+        log_data["timestamp"] = self.formatTime(record, self.datefmt)
+        log_data["level"] = record.levelname
+        log_data["name"] = record.name
+        log_data["message"] = record.message
+        log_data.update(message_dict)
+        merge_record_extra(record, log_data, reserved=self._skip_fields)
+    
+    def jsonify_log_record(self, log_data):
+        return orjson.dumps(
+            log_data,
+            default=self.json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+        ).decode()
+
+class RecordQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener's handlers
+    
+    The stock prepare() folds the traceback into the message and drops
+    exc_info, so the JSON file would lose its exc_info field. This one
+    only merges args into the message; exc_info and extra fields stay on
+    the record for the listener's formatters.
+    """
+    
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 def setup_logger(name: str, log_file: str = None):
     """
     Setup structured JSON logger for production
     
+    Records are only enqueued by the calling thread; a background
+    QueueListener does the formatting and console/file I/O, so request
+    threads never wait on a disk write.
+    
+    Setup is idempotent: repeat calls for the same name return the
+    logger configured by the first call, without adding handlers.
+    
     Usage:
         logger = setup_logger(__name__)
         logger.info("User signed up", extra={"email": "user@example.com"})
     """
+    if name in _configured:
+        return _configured[name]
+    
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
     
-    # Remove any existing handlers to avoid duplicates
+    # Drop handlers attached outside setup_logger
     logger.handlers.clear()
     
     # Console handler (human-readable)
@@ -25,28 +105,31 @@ def setup_logger(name: str, log_file: str = None):
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler (JSON format)
     if log_file:
-        Path("logs").mkdir(exist_ok=True)
-        file_handler = logging.FileHandler(f"logs/{log_file}")
-        
-        # FIX: Use correct field names for JSON formatter
-        json_format = jsonlogger.JsonFormatter(
-            '%(asctime)s %(levelname)s %(name)s %(message)s',
-            rename_fields={
-                'asctime': 'timestamp',
-                'levelname': 'level'
-            },
-            datefmt='%Y-%m-%d %H:%M:%S'
+        # Rotation runs on the listener thread, never on a request thread
+        file_handler = RotatingFileHandler(
+            LOG_DIR / log_file,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT
         )
-        file_handler.setFormatter(json_format)
-        logger.addHandler(file_handler)
+        
+        file_handler.setFormatter(JsonLogFormatter())
+        handlers.append(file_handler)
+    
+    log_queue = queue.Queue(-1)
+    logger.addHandler(RecordQueueHandler(log_queue))
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
     
     # Prevent propagation to root logger
     logger.propagate = False
     
+    _configured[name] = logger
     return logger
 
 # Usage in your code
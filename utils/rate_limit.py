@@ -0,0 +1,129 @@
+import math
+import time
+import uuid
+from typing import Optional
+
+# Sliding window over a sorted set: members are request ids scored by
+# timestamp. Runs atomically on the Redis server so concurrent workers
+# can never both slip under the limit.
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+local count = redis.call('ZCARD', key)
+if count >= limit then
+    local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    return {0, count, tostring(oldest[2])}
+end
+
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('EXPIRE', key, math.ceil(window))
+return {1, count + 1, '0'}
+"""
+
+_scripts = {}
+
+
+def _script(client, source):
+    """Register a Lua script once per client (EVALSHA after the first call)."""
+    key = (id(client), source)
+    if key not in _scripts:
+        _scripts[key] = client.register_script(source)
+    return _scripts[key]
+
+
+def sliding_window_hit(client, key: str, limit: int, window_seconds: int, member: Optional[str] = None):
+    """
+    Record one request against a sliding-window limit.
+
+    `member` identifies the request in the window so sliding_window_refund
+    can take it back out; a random id is used when none is given.
+
+    Returns:
+        tuple: (allowed, count, retry_after) where count is the number of
+        requests in the current window and retry_after is the number of
+        seconds until the oldest request leaves the window (0 if allowed).
+    """
+    now = time.time()
+    allowed, count, oldest = _script(client, SLIDING_WINDOW_SCRIPT)(
+        keys=[key],
+        args=[now, window_seconds, limit, member or uuid.uuid4().hex],
+    )
+    if allowed:
+        return True, int(count), 0
+
+    retry_after = max(1, math.ceil(float(oldest) + window_seconds - now))
+    return False, int(count), retry_after
+
+
+def sliding_window_refund(client, key: str, member: str):
+    """Take a request recorded by sliding_window_hit back out of the window, e.g. when it was rejected later on"""
+    client.zrem(key, member)
+
+
+# Monthly quota counter mirroring users.usage_count. A missing counter is
+# seeded from the database value passed in ARGV[3]; with no seed the script
+# returns -1 so the caller can look it up and retry. Idle counters expire
+# and are re-seeded from the database on next use.
+QUOTA_SCRIPT = """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+
+local used = tonumber(redis.call('GET', key))
+if used == nil then
+    if ARGV[3] == '' then
+        return {-1, 0}
+    end
+    used = tonumber(ARGV[3])
+end
+
+local allowed = 0
+if used < limit then
+    used = used + 1
+    allowed = 1
+end
+
+redis.call('SET', key, used, 'EX', math.ceil(ttl))
+return {allowed, used}
+"""
+
+# Give back a request taken by QUOTA_SCRIPT, unless the counter expired
+QUOTA_REFUND_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('DECR', KEYS[1])
+end
+return -1
+"""
+
+
+def quota_take(client, key: str, limit: int, ttl_seconds: int, load_used):
+    """
+    Count one request against a quota shared with the usage_count column.
+
+    `load_used` returns the database usage count; it is only called when
+    Redis holds no counter for the key yet.
+
+    Returns:
+        tuple: (allowed, used) where used is the request count including
+        this request when it was allowed.
+    """
+    script = _script(client, QUOTA_SCRIPT)
+    allowed, used = script(keys=[key], args=[limit, ttl_seconds, ""])
+    if allowed == -1:
+        allowed, used = script(keys=[key], args=[limit, ttl_seconds, load_used()])
+    return bool(allowed), int(used)
+
+
+def quota_refund(client, key: str):
+    """Return one request to a quota, e.g. when the job it paid for was never created"""
+    _script(client, QUOTA_REFUND_SCRIPT)(keys=[key])
+
+
+def quota_used(client, key: str):
+    """The request count held in Redis, or None when the counter is not seeded"""
+    used = client.get(key)
+    return None if used is None else int(used)
@@ -0,0 +1,23 @@
+import os
+from functools import lru_cache
+
+import redis
+
+
+@lru_cache(maxsize=1)
+def get_redis():
+    """
+    Return the shared Redis client, or None when REDIS_URL is not set.
+
+    Callers fall back to their in-process / database behaviour when this
+    returns None, so local development and tests work without Redis.
+
+    Usage:
+        client = get_redis()
+        if client is not None:
+            client.set("key", "value")
+    """
+    url = os.getenv("REDIS_URL")
+    if not url:
+        return None
+    return redis.Redis.from_url(url, decode_responses=True)
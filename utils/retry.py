@@ -1,29 +1,73 @@
+import asyncio
+import inspect
+import random
 import time
 import logging
 from functools import wraps
 
 logger = logging.getLogger(__name__)
 
-def retry_on_failure(max_retries=3, delay=2, backoff=2):
-    """Retry decorator with exponential backoff"""
+def retry_on_failure(
+    max_retries=3,
+    delay=2,
+    backoff=2,
+    max_delay=30,
+    jitter=0.1,
+    retry_exceptions=(TimeoutError, ConnectionError)
+):
+    """
+    Retry decorator with capped, jittered exponential backoff.
+
+    Works on both plain and async functions; async functions wait with
+    asyncio.sleep so the event loop (or threadpool worker) is not blocked.
+    Only retry_exceptions are retried, anything else is raised at once.
+    """
+    def next_delay(current_delay):
+        # Random jitter keeps clients that failed together from retrying in lockstep
+        return current_delay + random.uniform(0, current_delay * jitter)
+
+    def on_failure(retries, e, current_delay):
+        if retries >= max_retries:
+            logger.error(f"Failed after {max_retries} retries: {str(e)}")
+            return False
+        logger.warning(f"Attempt {retries} failed: {str(e)}. Retrying in {current_delay:.1f}s...")
+        return True
+
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                retries = 0
+                current_delay = delay
+
+                while True:
+                    try:
+                        return await func(*args, **kwargs)
+                    except retry_exceptions as e:
+                        retries += 1
+                        wait = next_delay(current_delay)
+                        if not on_failure(retries, e, wait):
+                            raise
+                        await asyncio.sleep(wait)
+                        current_delay = min(current_delay * backoff, max_delay)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             retries = 0
             current_delay = delay
-            
-            while retries < max_retries:
+
+            while True:
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except retry_exceptions as e:
                     retries += 1
-                    if retries >= max_retries:
-                        logger.error(f"Failed after {max_retries} retries: {str(e)}")
+                    wait = next_delay(current_delay)
+                    if not on_failure(retries, e, wait):
                         raise
-                    
-                    logger.warning(f"Attempt {retries} failed: {str(e)}. Retrying in {current_delay}s...")
-                    time.sleep(current_delay)
-                    current_delay *= backoff
-            
+                    time.sleep(wait)
+                    current_delay = min(current_delay * backoff, max_delay)
+
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator